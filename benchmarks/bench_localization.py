@@ -0,0 +1,281 @@
+"""Benchmarky lokalizácie - vyhľadávanie, načítanie katalógov a prepnutie jazyka
+
+Spustenie z koreňa projektu (bez okna, stránka Flet je nahradená stubom):
+
+    python -m benchmarks.bench_localization --output bench_results.json
+    python -m benchmarks.bench_localization --quick --compare bench_results.json
+
+Meria import (headless vs. s widgetmi), get(), načítanie katalógov a switch_locale.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import flet as ft
+
+from locales.binary_catalog import compile_directory
+from locales.localization import (
+    CatalogStore,
+    LocaleInfo,
+    LocalizationService,
+    LocalizedDropdown,
+    LocalizedNavigationBar,
+    LocalizedText,
+    TextDirection,
+)
+
+FULL_GRID = {
+    "catalog_keys": [100, 1_000, 10_000, 100_000],
+    "catalog_locales": [3, 10, 50],
+    "controls": [10, 100, 1_000, 10_000],
+}
+QUICK_GRID = {
+    "catalog_keys": [100, 1_000],
+    "catalog_locales": [3, 10],
+    "controls": [10, 100],
+}
+
+class StubPage:
+    """Náhrada za ft.Page - iba počíta update() volania"""
+    def __init__(self):
+        self.updates = 0
+
+    def update(self, *controls):
+        self.updates += 1
+
+def locale_codes(count: int) -> List[str]:
+    return ["en"] + [f"l{index:02d}" for index in range(1, count)]
+
+def write_catalogs(directory: str, keys: int, locales: int) -> None:
+    """Syntetické katalógy - fallback jazyk má všetky kľúče, ostatné 90 %"""
+    for code in locale_codes(locales):
+        step = 1 if code == "en" else 10
+        catalog = {
+            f"key_{index}": f"{code} value {index}"
+            for index in range(keys)
+            if code == "en" or index % step
+        }
+        with open(os.path.join(directory, f"{code}.json"), 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, ensure_ascii=False)
+
+def make_service(directory: str, locales: int, store: Optional[CatalogStore] = None) -> LocalizationService:
+    service = LocalizationService(translations_dir=directory, catalog_store=store or CatalogStore())
+    for code in locale_codes(locales):
+        service.supported_locales.setdefault(code, LocaleInfo(code, code, TextDirection.LTR, ""))
+    return service
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Najlepší čas z niekoľkých behov v sekundách"""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def bench_get(root: str) -> List[Dict[str, Any]]:
+    directory = os.path.join(root, "get_catalogs")
+    os.makedirs(directory)
+    write_catalogs(directory, 1_000, 3)
+    service = make_service(directory, 3)
+    service.switch_locale("l01")
+    cases = {
+        "hit": "key_1",        # v aktuálnom jazyku
+        "fallback": "key_10",  # iba v "en"
+        "miss": "missing_key",
+    }
+    results = []
+    for case, key in cases.items():
+        number = 200_000
+        seconds = min(timeit.repeat(lambda: service.get(key), number=number, repeat=5))
+        results.append({
+            "name": "get",
+            "params": {"case": case},
+            "seconds": seconds / number,
+            "ops_per_sec": number / seconds,
+        })
+    return results
+
+def bench_load(root: str, grid: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+    results = []
+    for keys in grid["catalog_keys"]:
+        for locales in grid["catalog_locales"]:
+            directory = os.path.join(root, f"catalogs_{keys}_{locales}")
+            os.makedirs(directory)
+            write_catalogs(directory, keys, locales)
+
+            for catalog_format in ("json", "compact", "binary"):
+                if catalog_format == "binary":
+                    compile_directory(directory)
+                compact = catalog_format == "compact"
+
+                def load_all():
+                    service = make_service(directory, locales, CatalogStore(compact=compact))
+                    for code in locale_codes(locales):
+                        service.catalog_store.catalog(directory, code)
+                    return service
+
+                gc.collect()
+                tracemalloc.start()
+                resident = load_all()
+                memory_bytes = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+                del resident
+
+                results.append({
+                    "name": "load_translations",
+                    "params": {"keys": keys, "locales": locales, "format": catalog_format},
+                    "seconds": best_of(
+                        lambda: make_service(directory, locales, CatalogStore(compact=compact)),
+                        repeat=3
+                    ),
+                })
+                results.append({
+                    "name": "load_all_catalogs",
+                    "params": {"keys": keys, "locales": locales, "format": catalog_format},
+                    "seconds": best_of(load_all, repeat=3),
+                    "memory_bytes": memory_bytes,
+                })
+    return results
+
+def mount_controls(service: LocalizationService, count: int, page: StubPage) -> List[Any]:
+    """Mix bežných komponentov - text, navigačný panel a dropdown"""
+    controls = []
+    for index in range(count):
+        kind = index % 10
+        if kind == 8:
+            control = LocalizedNavigationBar(
+                service,
+                destinations=[
+                    {"key": f"key_{index + offset}", "icon": ft.Icons.HOME}
+                    for offset in range(5)
+                ]
+            )
+        elif kind == 9:
+            control = LocalizedDropdown(
+                service,
+                label_config={"key": f"key_{index}"},
+                options_config=[{"key": f"key_{index + offset}"} for offset in range(3)]
+            )
+        else:
+            control = LocalizedText(service, f"key_{index}")
+        control.page = page
+        controls.append(control)
+    return controls
+
+def bench_switch(root: str, grid: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+    directory = os.path.join(root, "switch_catalogs")
+    os.makedirs(directory)
+    write_catalogs(directory, max(grid["controls"]) + 10, 3)
+
+    results = []
+    for count in grid["controls"]:
+        service = make_service(directory, 3)
+        page = StubPage()
+        controls = mount_controls(service, count, page)
+        service.preload(["l01", "l02"])
+
+        targets = iter(["l01", "l02"] * 10)
+        seconds = best_of(lambda: service.switch_locale(next(targets)))
+        page.updates = 0
+        service.switch_locale(next(targets))
+        results.append({
+            "name": "switch_locale",
+            "params": {"controls": count},
+            "seconds": seconds,
+            "page_updates": page.updates,
+        })
+        del controls
+    return results
+
+IMPORT_CASES = {
+    # Iba služba - bez Flet a bez widgetov
+    "headless": "from locales.localization import LocalizationService",
+    "widgets": "from locales.localization import LocalizationService, LocalizedText",
+}
+
+def bench_import(repeat: int = 5) -> List[Dict[str, Any]]:
+    """Čas importu v čistom procese (startup servera alebo CLI nástroja)"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for case, statement in IMPORT_CASES.items():
+        code = (
+            "import time; start = time.perf_counter(); "
+            f"{statement}; "
+            "LocalizationService(); print(time.perf_counter() - start)"
+        )
+        timings = [
+            float(subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=root, check=True, capture_output=True, text=True
+            ).stdout)
+            for _ in range(repeat)
+        ]
+        results.append({"name": "import", "params": {"case": case}, "seconds": min(timings)})
+    return results
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, threshold: float) -> List[str]:
+    """Porovná výsledky so starším súborom, vráti zoznam regresií"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {
+            (item["name"], json.dumps(item["params"], sort_keys=True)): item["seconds"]
+            for item in json.load(f)["results"]
+        }
+    regressions = []
+    for item in results:
+        previous = baseline.get((item["name"], json.dumps(item["params"], sort_keys=True)))
+        if previous and item["seconds"] > previous * (1 + threshold):
+            regressions.append(
+                f"{item['name']} {item['params']}: {previous:.6g}s -> {item['seconds']:.6g}s"
+            )
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarky lokalizácie")
+    parser.add_argument("--output", default="bench_results.json", help="výstupný JSON súbor")
+    parser.add_argument("--quick", action="store_true", help="menšia mriežka parametrov")
+    parser.add_argument("--compare", help="JSON s predchádzajúcimi výsledkami")
+    parser.add_argument("--threshold", type=float, default=0.2, help="povolené spomalenie (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    grid = QUICK_GRID if args.quick else FULL_GRID
+    with tempfile.TemporaryDirectory() as root:
+        results = bench_import()
+        results += bench_get(root)
+        results += bench_load(root, grid)
+        results += bench_switch(root, grid)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "grid": grid,
+        },
+        "results": results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    for item in results:
+        print(f"{item['name']:<20} {json.dumps(item['params']):<50} {item['seconds']:.6g}s")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESIA: {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
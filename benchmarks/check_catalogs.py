@@ -0,0 +1,131 @@
+"""Kontroly konzistencie katalógov - rovnaké preklady vo všetkých režimoch
+
+Spustenie z koreňa projektu (bez Flet, iba služba):
+
+    python -m benchmarks.check_catalogs
+
+Každá kontrola vráti zoznam chýb. Návratový kód 1, ak niektorá zlyhá.
+"""
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from locales.binary_catalog import BinaryCatalog, compile_catalog
+from locales.core import CatalogStore, LocalizationService
+from locales.gettext_catalog import MoCatalog, compile_po, parse_po, write_mo
+from locales.nested import flatten_catalog
+
+# Prázdne hodnoty, diakritika, znaky mimo BMP a vnorené sekcie
+ROUND_TRIP_CATALOGS: List[Dict[str, Any]] = [
+    {},
+    {"empty": "", "hello": "Ahoj"},
+    {"žltý_kôň": "Príliš žluťoučký kůň", "emoji": "🇸🇰 ✓", "a": "b", "ä": "c", "z": "ž"},
+    {"login": {"title": "Prihlásenie", "form": {"user": "Používateľ", "pass": "Heslo"}}, "login_x": "x"},
+]
+
+def _write_json(directory: str, name: str, catalog: Dict[str, Any]) -> None:
+    path = os.path.join(directory, f"{name}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False)
+
+def check_compact_namespaces() -> List[str]:
+    """Kompaktný režim s mennými priestormi vráti to isté ako slovníky"""
+    errors = []
+    with tempfile.TemporaryDirectory() as directory:
+        _write_json(directory, "sk", {"hello": "Ahoj", "login": {"title": "T-sk-main"}})
+        _write_json(directory, "en", {"hello": "Hello", "only_en": "E", "login": {"hint": "H-en-main"}})
+        _write_json(directory, "sk/login", {"button": "B-sk-ns"})
+        _write_json(directory, "en/login", {"title": "T-en-ns", "button": "B-en-ns", "hint": "H-en-ns"})
+        keys = ["hello", "only_en", "login.title", "login.button", "login.hint", "missing"]
+
+        results = {}
+        for compact in (False, True):
+            service = LocalizationService(
+                translations_dir=directory,
+                default_locale="sk",
+                catalog_store=CatalogStore(compact=compact)
+            )
+            service.load_namespaces("login")
+            results[compact] = {key: [service.get(key)] for key in keys}
+            for key in keys:
+                # Cesta komponentov - ID kľúča zistené raz, potom get_by_id
+                key_id = service.key_id(key)
+                if key_id is not None:
+                    results[compact][key].append(service.get_by_id(key_id, key))
+        for key in keys:
+            expected = results[False][key][0]
+            for value in results[True][key]:
+                if value != expected:
+                    errors.append(f"kľúč {key}: slovníky '{expected}', kompaktný režim '{value}'")
+    return errors
+
+def _compare(name: str, expected: Mapping[str, str], catalog: Mapping[str, str]) -> List[str]:
+    """Obsah aj binárne vyhľadanie každého kľúča skompilovaného katalógu"""
+    errors = []
+    if dict(catalog) != dict(expected):
+        errors.append(f"{name}: obsah {dict(catalog)} namiesto {dict(expected)}")
+    for key, value in expected.items():
+        if catalog.get(key) != value:
+            errors.append(f"{name}: kľúč '{key}' vrátil {catalog.get(key)!r} namiesto {value!r}")
+    if catalog.get("chýbajúci") is not None:
+        errors.append(f"{name}: našiel sa neexistujúci kľúč")
+    return errors
+
+def check_round_trip() -> List[str]:
+    """Skompilovaný .catalog a .mo vrátia po načítaní presne zdrojové preklady"""
+    errors = []
+    with tempfile.TemporaryDirectory() as directory:
+        for number, source in enumerate(ROUND_TRIP_CATALOGS):
+            for prefix in ("", "login"):
+                json_path = os.path.join(directory, f"c{number}{prefix}.json")
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(source, f, ensure_ascii=False)
+                expected = flatten_catalog(source, prefix)
+                # Katalógy sa hneď uvoľnia - mmap by na Windows blokoval zmazanie priečinka
+                errors += _compare(
+                    f".catalog {number} '{prefix}'", expected,
+                    BinaryCatalog(compile_catalog(json_path, prefix=prefix))
+                )
+
+                # Parser .po vynecháva nepreložené (prázdne) správy
+                messages = {key: value for key, value in expected.items() if value}
+                errors += _compare(
+                    f".mo {number} '{prefix}'", messages,
+                    MoCatalog(write_mo(messages, os.path.join(directory, f"c{number}{prefix}.mo")))
+                )
+
+        po_path = os.path.join(directory, "sk.po")
+        with open(po_path, 'w', encoding='utf-8') as f:
+            f.write(
+                'msgid ""\nmsgstr "Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+                'msgctxt "menu"\nmsgid "home"\nmsgstr "Domov"\n\n'
+                'msgid "žltý"\nmsgstr ""\n"Žltý "\n"kôň"\n\n'
+                'msgid "untranslated"\nmsgstr ""\n'
+            )
+        for prefix in ("", "login"):
+            errors += _compare(
+                f".po → .mo '{prefix}'", parse_po(po_path, prefix),
+                MoCatalog(compile_po(po_path, os.path.join(directory, f"sk{prefix}.mo"), prefix))
+            )
+    return errors
+
+CHECKS: List[Callable[[], List[str]]] = [
+    check_compact_namespaces,
+    check_round_trip,
+]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    failed = 0
+    for check in CHECKS:
+        errors = check()
+        for error in errors:
+            print(f"CHYBA {check.__name__}: {error}")
+        print(f"{check.__name__}: {'OK' if not errors else 'CHYBA'}")
+        failed += bool(errors)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Záťažový test vlákien - prepínanie jazyka, registrácie a get() naraz
+
+Spustenie z koreňa projektu (bez Flet, iba služba):
+
+    python -m benchmarks.stress_threads
+    python -m benchmarks.stress_threads --switchers 8 --churners 4 --seconds 10
+
+Každá obnova musí vidieť jeden jazyk - listener porovná current_locale
+s textom z get(). Na konci musia všetky živé listenery zobrazovať
+posledný jazyk. Návratový kód 1 pri nekonzistencii alebo výnimke.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from locales.core import CatalogStore, LocalizationService
+
+CATALOGS = {
+    "en": {"hello": "Hello"},
+    "sk": {"hello": "Ahoj"},
+    "cs": {"hello": "Dobrý den"},
+}
+
+class Listener:
+    """Komponent bez UI - pri obnove skontroluje, že jazyk a text patria k sebe"""
+    def __init__(self, service: LocalizationService, errors: List[str]):
+        self.service = service
+        self.errors = errors
+        self.text: Optional[str] = None
+        self.locale: Optional[str] = None
+
+    def update_localization(self) -> None:
+        locale = self.service.current_locale
+        time.sleep(0)  # Uvoľní GIL - súbežné prepnutie by sa prejavilo práve tu
+        text = self.service.get("hello")
+        if text != CATALOGS[locale]["hello"]:
+            self.errors.append(f"obnova videla jazyk {locale} a text '{text}'")
+        self.locale = locale
+        self.text = text
+
+def run(switchers: int, churners: int, readers: int, seconds: float, listeners: int) -> Dict[str, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        for code, catalog in CATALOGS.items():
+            with open(os.path.join(directory, f"{code}.json"), 'w', encoding='utf-8') as f:
+                json.dump(catalog, f, ensure_ascii=False)
+
+        service = LocalizationService(translations_dir=directory, catalog_store=CatalogStore())
+        errors: List[str] = []
+        counters = {"switches": 0, "registrations": 0, "lookups": 0}
+        counters_lock = threading.Lock()
+        # Stabilné listenery, ktoré musia na konci zobrazovať posledný jazyk
+        stable = [Listener(service, errors) for _ in range(listeners)]
+        for listener in stable:
+            service.add_listener(listener.update_localization)
+        deadline = time.perf_counter() + seconds
+
+        def guarded(func):
+            def target():
+                try:
+                    count = func()
+                except Exception as e:
+                    errors.append(f"{type(e).__name__}: {e}")
+                    return
+                with counters_lock:
+                    counters[func.__name__] += count
+            return target
+
+        def switches() -> int:
+            count = 0
+            codes = list(CATALOGS)
+            while time.perf_counter() < deadline:
+                service.switch_locale(random.choice(codes))
+                count += 1
+            return count
+
+        def registrations() -> int:
+            # Vytvorenie a dispose komponentov počas obnovy z iného vlákna
+            count = 0
+            while time.perf_counter() < deadline:
+                batch = [Listener(service, errors) for _ in range(20)]
+                for listener in batch:
+                    service.add_listener(listener.update_localization)
+                for listener in batch[::2]:
+                    service.remove_listener(listener.update_localization)
+                count += len(batch)
+                del batch  # Zvyšok odstráni slabá referencia
+            return count
+
+        def lookups() -> int:
+            count = 0
+            while time.perf_counter() < deadline:
+                if not service.get("hello"):
+                    errors.append("get() vrátil prázdny text")
+                count += 1
+            return count
+
+        threads = (
+            [threading.Thread(target=guarded(switches)) for _ in range(switchers)]
+            + [threading.Thread(target=guarded(registrations)) for _ in range(churners)]
+            + [threading.Thread(target=guarded(lookups)) for _ in range(readers)]
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Posledné prepnutie musí obnoviť všetky stabilné listenery
+        final = next(code for code in CATALOGS if code != service.current_locale)
+        service.switch_locale(final)
+        stale = [listener for listener in stable if listener.locale != final]
+        if stale:
+            errors.append(f"{len(stale)} listenerov nezobrazuje posledný jazyk {final}")
+
+        for error in sorted(set(errors)):
+            print(f"CHYBA {error}")
+        return {**counters, "errors": len(errors), "listeners": service.listener_count()}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Záťažový test lokalizácie z viacerých vlákien")
+    parser.add_argument("--switchers", type=int, default=8, help="vlákna prepínajúce jazyk")
+    parser.add_argument("--churners", type=int, default=4, help="vlákna registrujúce a odoberajúce listenery")
+    parser.add_argument("--readers", type=int, default=4, help="vlákna volajúce get()")
+    parser.add_argument("--listeners", type=int, default=200, help="počet stabilných listenerov")
+    parser.add_argument("--seconds", type=float, default=3.0, help="dĺžka testu")
+    args = parser.parse_args(argv)
+
+    # Častejšie prepínanie vlákien odhalí viac súbehov
+    sys.setswitchinterval(1e-5)
+    result = run(args.switchers, args.churners, args.readers, args.seconds, args.listeners)
+    print(json.dumps(result))
+    return 1 if result["errors"] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
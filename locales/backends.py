@@ -0,0 +1,60 @@
+import json
+import os
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from .binary_catalog import compiled_path, load_compiled
+from .nested import flatten_catalog, split_catalog_id
+
+class CatalogBackend:
+    """Formát prekladových súborov v priečinku translations
+
+    Backend nájde a načíta katalóg podľa ID ("sk" alebo "sk/login"),
+    CatalogStore sa stará o cache, LRU a hot-reload.
+    """
+    extension = ".json"
+
+    # Backendy rovnakého typu a nastavenia sú zameniteľné - nová inštancia
+    # v každej session nesmie zahodiť zdieľané katalógy
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and vars(other) == vars(self)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
+    def source_path(self, translations_dir: str, catalog_id: str) -> str:
+        return os.path.join(translations_dir, f"{catalog_id}{self.extension}")
+
+    def source_mtime(self, translations_dir: str, catalog_id: str) -> Optional[float]:
+        """Čas zmeny zdroja, podľa ktorého hot-reload pozná zmenený katalóg"""
+        path = self.source_path(translations_dir, catalog_id)
+        return os.path.getmtime(path) if os.path.exists(path) else None
+
+    def read(self, translations_dir: str, catalog_id: str) -> Optional[Mapping[str, str]]:
+        """Plochý katalóg iba na čítanie, None ak súbor neexistuje"""
+        raise NotImplementedError
+
+class JsonCatalogBackend(CatalogBackend):
+    """JSON katalógy (aj vnorené), skompilovaný .catalog má prednosť"""
+    def source_mtime(self, translations_dir: str, catalog_id: str) -> Optional[float]:
+        """Najnovší čas zmeny JSON alebo skompilovaného katalógu"""
+        file_path = self.source_path(translations_dir, catalog_id)
+        mtimes = [
+            os.path.getmtime(path) for path in (file_path, compiled_path(file_path))
+            if os.path.exists(path)
+        ]
+        return max(mtimes) if mtimes else None
+
+    def read(self, translations_dir: str, catalog_id: str) -> Optional[Mapping[str, str]]:
+        file_path = self.source_path(translations_dir, catalog_id)
+        # Skompilovaný katalóg má prednosť, JSON je záloha
+        if (compiled := load_compiled(file_path)) is not None:
+            return compiled
+        if not os.path.exists(file_path):
+            return None
+        _, namespace = split_catalog_id(catalog_id)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return MappingProxyType(flatten_catalog(json.load(f), namespace or ""))
+
+# Predvolený backend priečinkov bez vlastného nastavenia
+json_backend = JsonCatalogBackend()
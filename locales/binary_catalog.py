@@ -0,0 +1,156 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import Dict, Iterator, List, Mapping, Optional
+
+from .nested import flatten_catalog
+
+# Formát skompilovaného katalógu:
+#   hlavička  - magic, verzia, počet kľúčov
+#   index     - pre každý kľúč (offset kľúča, dĺžka, offset hodnoty, dĺžka),
+#               zoradený podľa UTF-8 bajtov kľúča
+#   reťazce   - UTF-8 tabuľka kľúčov a hodnôt
+MAGIC = b"L10C"
+VERSION = 1
+EXTENSION = ".catalog"
+
+_HEADER = struct.Struct("<4sHHI")
+_ENTRY = struct.Struct("<IIII")
+
+def compiled_path(json_path: str) -> str:
+    """Cesta ku skompilovanému katalógu pre JSON súbor"""
+    return os.path.splitext(json_path)[0] + EXTENSION
+
+def compile_catalog(json_path: str, output_path: Optional[str] = None, prefix: str = "") -> str:
+    """Skompiluje JSON katalóg do binárneho formátu, vráti cestu k výstupu
+
+    Vnorené sekcie sa zploštia, prefix je menný priestor súboru (napr. "login").
+    """
+    output_path = output_path or compiled_path(json_path)
+    with open(json_path, 'r', encoding='utf-8') as f:
+        translations: Dict[str, str] = flatten_catalog(json.load(f), prefix)
+
+    entries = []
+    for key, value in translations.items():
+        if not isinstance(value, str):
+            raise ValueError(f"Hodnota kľúča '{key}' v {json_path} nie je reťazec")
+        entries.append((key.encode('utf-8'), value.encode('utf-8')))
+    entries.sort()
+
+    index = bytearray()
+    strings = bytearray()
+    base = _HEADER.size + _ENTRY.size * len(entries)
+    for key, value in entries:
+        key_offset = base + len(strings)
+        strings += key
+        value_offset = base + len(strings)
+        strings += value
+        index += _ENTRY.pack(key_offset, len(key), value_offset, len(value))
+
+    # Zápis cez jedinečný dočasný súbor - čitatelia nikdy nevidia polovičný
+    # katalóg a súbežné kompilácie si neprepíšu dočasné súbory
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(output_path)}.", suffix=".tmp",
+        dir=os.path.dirname(output_path) or "."
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, len(entries)))
+            f.write(index)
+            f.write(strings)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_path
+
+def compile_directory(translations_dir: str) -> List[str]:
+    """Skompiluje všetky JSON katalógy v priečinku vrátane menných priestorov"""
+    outputs = []
+    for name in sorted(os.listdir(translations_dir)):
+        path = os.path.join(translations_dir, name)
+        if name.endswith(".json"):
+            outputs.append(compile_catalog(path))
+        elif os.path.isdir(path):
+            # translations/<locale>/<namespace>.json
+            outputs.extend(
+                compile_catalog(os.path.join(path, namespace), prefix=namespace[:-len(".json")])
+                for namespace in sorted(os.listdir(path))
+                if namespace.endswith(".json")
+            )
+    return outputs
+
+class BinaryCatalog(Mapping[str, str]):
+    """Katalóg iba na čítanie nad mmap, reťazce sa dekódujú až pri vyhľadaní"""
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Neplatný skompilovaný katalóg: {path}")
+        self.path = path
+        self._count = count
+
+    def _entry(self, index: int):
+        return _ENTRY.unpack_from(self._mm, _HEADER.size + index * _ENTRY.size)
+
+    def _find(self, key: str) -> int:
+        """Binárne vyhľadanie kľúča v indexe, -1 ak chýba"""
+        needle = key.encode('utf-8')
+        mm = self._mm
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            key_offset, key_length, _, _ = self._entry(middle)
+            current = mm[key_offset:key_offset + key_length]
+            if current < needle:
+                low = middle + 1
+            elif current > needle:
+                high = middle - 1
+            else:
+                return middle
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        _, _, value_offset, value_length = self._entry(index)
+        return self._mm[value_offset:value_offset + value_length].decode('utf-8')
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        index = self._find(key)
+        if index < 0:
+            return default
+        _, _, value_offset, value_length = self._entry(index)
+        return self._mm[value_offset:value_offset + value_length].decode('utf-8')
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            key_offset, key_length, _, _ = self._entry(index)
+            yield self._mm[key_offset:key_offset + key_length].decode('utf-8')
+
+    def __len__(self) -> int:
+        return self._count
+
+def load_compiled(json_path: str) -> Optional[BinaryCatalog]:
+    """Otvorí skompilovaný katalóg, ak existuje a nie je starší ako JSON"""
+    path = compiled_path(json_path)
+    if not os.path.exists(path):
+        return None
+    if os.path.exists(json_path) and os.path.getmtime(path) < os.path.getmtime(json_path):
+        return None
+    return BinaryCatalog(path)
+
+if __name__ == '__main__':
+    # python -m locales.binary_catalog [translations_dir]
+    for output in compile_directory(sys.argv[1] if len(sys.argv) > 1 else "translations"):
+        print(output)
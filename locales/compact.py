@@ -0,0 +1,97 @@
+import threading
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+class KeyTable:
+    """Kľúče prekladov internované na celé čísla, spoločné pre všetky jazyky"""
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.keys: List[str] = []
+        # Pool hodnôt načítaných katalógov - rovnaký text v rôznych jazykoch
+        # je v pamäti iba raz
+        self._strings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, key: str) -> int:
+        key_id = self.ids.get(key)
+        if key_id is None:
+            with self._lock:
+                key_id = self.ids.get(key)
+                if key_id is None:
+                    key_id = len(self.keys)
+                    self.keys.append(key)
+                    self.ids[key] = key_id
+        return key_id
+
+    def intern_value(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def retain_values(self, catalogs: Iterable["CompactCatalog"]) -> None:
+        """Ponechá v poole iba hodnoty daných (načítaných) katalógov"""
+        strings = {
+            value: value
+            for catalog in catalogs
+            for value in catalog.values if value is not None
+        }
+        with self._lock:
+            self._strings = strings
+
+class CompactCatalog(Mapping[str, str]):
+    """Katalóg jazyka ako pole hodnôt indexované ID kľúča"""
+    def __init__(self, table: KeyTable, entries: Mapping[str, str]):
+        self.table = table
+        values: List[Optional[str]] = []
+        for key, value in entries.items():
+            key_id = table.intern(key)
+            if key_id >= len(values):
+                values.extend([None] * (key_id + 1 - len(values)))
+            values[key_id] = table.intern_value(value)
+        self.values: Sequence[Optional[str]] = tuple(values)
+        self._count = len(entries)
+
+    def by_id(self, key_id: int) -> Optional[str]:
+        values = self.values
+        return values[key_id] if key_id < len(values) else None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        key_id = self.table.ids.get(key)
+        if key_id is None:
+            return default
+        value = self.by_id(key_id)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self.table.keys
+        return (keys[key_id] for key_id, value in enumerate(self.values) if value is not None)
+
+    def __len__(self) -> int:
+        return self._count
+
+class CompactLookup:
+    """Zlúčená tabuľka prekladov (jazyk → fallback → en) ako jedno pole hodnôt"""
+    def __init__(self, table: KeyTable, catalogs: List[CompactCatalog]):
+        self.table = table
+        size = max((len(catalog.values) for catalog in catalogs), default=0)
+        values: List[Optional[str]] = [None] * size
+        # Od najnižšej priority, aby vyššia priorita prepísala nižšiu
+        for catalog in reversed(catalogs):
+            for key_id, value in enumerate(catalog.values):
+                if value:
+                    values[key_id] = value
+        self.values: Sequence[Optional[str]] = tuple(values)
+
+    def by_id(self, key_id: int) -> Optional[str]:
+        values = self.values
+        return values[key_id] if key_id < len(values) else None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        key_id = self.table.ids.get(key)
+        if key_id is None or key_id >= len(self.values):
+            return default
+        value = self.values[key_id]
+        return default if value is None else value
@@ -0,0 +1,937 @@
+from typing import Dict, Optional, List, Callable, Any, Tuple, Mapping, Iterable, Set, TYPE_CHECKING
+import os
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+from dataclasses import dataclass
+from enum import Enum
+
+from .backends import CatalogBackend, json_backend
+from .binary_catalog import BinaryCatalog
+from .compact import CompactCatalog, CompactLookup, KeyTable
+from .formatting import LocaleFormatter, formatter_for
+from .messages import compile_template, plural_category
+from .nested import catalog_id, split_catalog_id
+from .stats import LocalizationStats, StatsHook
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# Bez logging.basicConfig - konfigurácia logovania patrí aplikácii
+logger = logging.getLogger(__name__)
+
+# Adresár balíka - rámce z neho sa pri hľadaní miesta volania preskakujú
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class TextDirection(Enum):
+    LTR = "ltr"
+    RTL = "rtl"
+
+@dataclass
+class LocaleInfo:
+    code: str
+    name: str
+    direction: TextDirection
+    flag_emoji: str
+
+class _ChainLookup:
+    """Lenivá tabuľka prekladov nad skompilovanými katalógmi, výsledky si pamätá"""
+    def __init__(self, catalogs: List[Mapping[str, str]]):
+        self._catalogs = catalogs
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        try:
+            value = self._resolved[key]
+        except KeyError:
+            value = None
+            for catalog in self._catalogs:
+                if translation := catalog.get(key):
+                    value = translation
+                    break
+            self._resolved[key] = value
+        return default if value is None else value
+
+class _MergedLookup(dict):
+    """Zlúčená tabuľka prekladov ako slovník"""
+    __slots__ = ("levels",)
+
+class _NamespaceLookup:
+    """Kompaktná tabuľka hlavných katalógov doplnená o malé menné priestory
+
+    Menné priestory nie sú v spoločnej tabuľke ID kľúčov - inak by každý
+    z nich mal pole hodnôt veľké ako celý hlavný katalóg. Prekrytie obsahuje
+    iba kľúče, ktoré nedefinuje hlavný katalóg jazyka s vyššou prioritou.
+    """
+    def __init__(self, namespaced: Dict[str, str], base: CompactLookup):
+        self._namespaced = namespaced
+        self._base = base
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._namespaced.get(key)
+        if value is None:
+            return self._base.get(key, default)
+        return value
+
+    def get_by_id(self, key_id: int, key: str) -> Optional[str]:
+        return self._namespaced.get(key) or self._base.by_id(key_id)
+
+class CatalogStore:
+    """Procesovo zdieľané katalógy prekladov, každý súbor sa parsuje iba raz
+
+    Katalógy sa načítajú až pri prvom použití. Pri nastavenom max_catalogs
+    ostáva v pamäti najviac toľko katalógov, najdlhšie nepoužité sa uvoľnia.
+    V kompaktnom režime (compact=True) sú kľúče internované na celé čísla
+    spoločné pre všetky jazyky a hodnoty uložené v poliach bez duplicít.
+
+    Katalóg menného priestoru translations/<locale>/<namespace>.json má ID
+    "<locale>/<namespace>" a jeho kľúče predponu "<namespace>.".
+    Formát súborov určuje backend priečinka (predvolene JSON).
+    """
+    def __init__(self, max_catalogs: Optional[int] = None, compact: bool = False):
+        self.max_catalogs = max_catalogs
+        self.compact = compact
+        self._key_tables: Dict[str, KeyTable] = {}
+        self._backends: Dict[str, CatalogBackend] = {}
+        self._catalogs: "OrderedDict[Tuple[str, str], Mapping[str, str]]" = OrderedDict()
+        # Kľúč: (priečinok, poradie jazykov, načítané menné priestory)
+        self._lookups: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], Mapping[str, str]] = {}
+        # Čas zmeny zdrojového súboru pri načítaní (pre hot-reload)
+        self._mtimes: Dict[Tuple[str, str], float] = {}
+        self._subscribers: Dict[str, "weakref.WeakSet[LocalizationService]"] = {}
+        self._watchers: Dict[str, threading.Event] = {}
+        self._lock = threading.RLock()
+
+    def catalog(self, translations_dir: str, locale: str) -> Mapping[str, str]:
+        """Vráti katalóg jazyka iba na čítanie, pri prvom použití ho načíta"""
+        key = (os.path.abspath(translations_dir), locale)
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is not None:
+                self._catalogs.move_to_end(key)
+                return catalog
+
+        # Parsovanie prebieha mimo zámku, aby sa jazyky dali načítať paralelne
+        mtime = self._source_mtime(key[0], locale)
+        catalog = self._load(key[0], locale)
+
+        with self._lock:
+            existing = self._catalogs.get(key)
+            if existing is not None:
+                self._catalogs.move_to_end(key)
+                return existing
+            self._catalogs[key] = catalog
+            self._mtimes[key] = mtime
+            self._evict()
+        return catalog
+
+    def lookup(
+        self,
+        translations_dir: str,
+        chain: Tuple[str, ...],
+        namespaces: Tuple[str, ...] = ()
+    ) -> Mapping[str, str]:
+        """Zlúčená tabuľka prekladov pre poradie jazykov (zdieľaná, nemeniť)"""
+        directory = os.path.abspath(translations_dir)
+        key = (directory, chain, namespaces)
+        # Menný priestor jazyka má prednosť pred jeho hlavným katalógom
+        ids = [
+            catalog_id(locale, namespace)
+            for locale in chain
+            for namespace in (*namespaces, None)
+        ]
+        with self._lock:
+            lookup = self._lookups.get(key)
+            if lookup is not None:
+                # Použitie tabuľky je aj použitím jej katalógov
+                for cid in ids:
+                    if (directory, cid) in self._catalogs:
+                        self._catalogs.move_to_end((directory, cid))
+                return lookup
+
+        catalogs = [self.catalog(translations_dir, cid) for cid in ids]
+        main = [catalog for cid, catalog in zip(ids, catalogs) if "/" not in cid]
+        if namespaces and main and all(isinstance(catalog, CompactCatalog) for catalog in main):
+            # Hlavné katalógy ostanú v zdieľanej kompaktnej tabuľke, menné priestory
+            # (v kompaktnom režime obyčajné slovníky) sa zlúčia zvlášť
+            by_id = dict(zip(ids, catalogs))
+            namespaced: Dict[str, str] = {}
+            for index in reversed(range(len(chain))):
+                # Preklad jazyka s vyššou prioritou má prednosť pred menným priestorom
+                higher = [by_id[chain[level]] for level in range(index)]
+                for namespace in namespaces:
+                    namespaced.update(
+                        (k, value) for k, value in by_id[catalog_id(chain[index], namespace)].items()
+                        if value and not any(catalog.get(k) for catalog in higher)
+                    )
+            lookup = _NamespaceLookup(namespaced, self.lookup(translations_dir, chain))
+        elif any(isinstance(catalog, BinaryCatalog) for catalog in catalogs):
+            # Skompilované katalógy nedekódujeme celé, iba kľúče, ktoré sa použijú
+            lookup = _ChainLookup(catalogs)
+        elif catalogs and all(isinstance(catalog, CompactCatalog) for catalog in catalogs):
+            lookup = CompactLookup(self.key_table(translations_dir), catalogs)
+        else:
+            lookup = _MergedLookup()
+            # Od najnižšej priority, aby vyššia priorita prepísala nižšiu
+            for catalog in reversed(catalogs):
+                lookup.update((k, value) for k, value in catalog.items() if value)
+        # Katalógy po jazykoch reťazca - meranie z nich zistí úroveň fallbacku
+        # bez ďalšieho prístupu do store
+        size = len(namespaces) + 1
+        lookup.levels = [catalogs[index:index + size] for index in range(0, len(catalogs), size)]
+
+        with self._lock:
+            return self._lookups.setdefault(key, lookup)
+
+    def backend(self, translations_dir: str) -> CatalogBackend:
+        """Backend, ktorým sa čítajú katalógy priečinka"""
+        return self._backends.get(os.path.abspath(translations_dir), json_backend)
+
+    def set_backend(self, translations_dir: str, backend: CatalogBackend) -> None:
+        """Nastaví formát katalógov priečinka, pri zmene zahodí načítané katalógy"""
+        directory = os.path.abspath(translations_dir)
+        with self._lock:
+            if self._backends.get(directory, json_backend) == backend:
+                return
+            self._backends[directory] = backend
+            self.invalidate(directory)
+
+    def key_table(self, translations_dir: str) -> KeyTable:
+        """Spoločná tabuľka ID kľúčov pre priečinok"""
+        directory = os.path.abspath(translations_dir)
+        table = self._key_tables.get(directory)
+        if table is None:
+            with self._lock:
+                table = self._key_tables.setdefault(directory, KeyTable())
+        return table
+
+    def key_id(self, translations_dir: str, key: str) -> Optional[int]:
+        """ID kľúča načítaného kompaktného katalógu, inak None
+
+        Neznámy kľúč sa neinternuje - tabuľka ID rastie iba s katalógmi.
+        """
+        if not self.compact:
+            return None
+        return self.key_table(translations_dir).ids.get(key)
+
+    def resident(self, translations_dir: str) -> Dict[str, Mapping[str, str]]:
+        """Katalógy priečinka, ktoré sú práve načítané v pamäti"""
+        directory = os.path.abspath(translations_dir)
+        with self._lock:
+            return {
+                locale: catalog for (path, locale), catalog in self._catalogs.items()
+                if path == directory
+            }
+
+    def invalidate(self, translations_dir: Optional[str] = None) -> None:
+        """Zahodí katalógy (všetky alebo pre jeden priečinok), načítajú sa znovu"""
+        with self._lock:
+            if translations_dir is None:
+                self._catalogs.clear()
+                self._lookups.clear()
+                self._mtimes.clear()
+                for directory in self._key_tables:
+                    self._prune_values(directory)
+                return
+            directory = os.path.abspath(translations_dir)
+            for cache in (self._catalogs, self._lookups, self._mtimes):
+                for key in [key for key in cache if key[0] == directory]:
+                    del cache[key]
+            self._prune_values(directory)
+
+    def refresh(self, translations_dir: str) -> Dict[str, Set[str]]:
+        """Znovu načíta zmenené katalógy priečinka, vráti zmenené kľúče podľa ID katalógu"""
+        directory = os.path.abspath(translations_dir)
+        with self._lock:
+            resident = [
+                (key, catalog, self._mtimes.get(key))
+                for key, catalog in self._catalogs.items() if key[0] == directory
+            ]
+
+        changes: Dict[str, Set[str]] = {}
+        for key, old, mtime in resident:
+            locale = key[1]
+            current_mtime = self._source_mtime(directory, locale)
+            if current_mtime == mtime:
+                continue
+            try:
+                new = self._load(directory, locale)
+            except Exception as e:
+                # Napr. súbor uložený do polovice - ostáva starý katalóg
+                logger.error(f"Chyba pri opätovnom načítaní jazyka {locale}: {str(e)}")
+                with self._lock:
+                    self._mtimes[key] = current_mtime
+                continue
+
+            changed = {k for k in set(old) | set(new) if old.get(k) != new.get(k)}
+            with self._lock:
+                if key not in self._catalogs:
+                    continue  # Medzitým uvoľnený
+                self._catalogs[key] = new
+                self._mtimes[key] = current_mtime
+                self._drop_lookups(directory, locale)
+                self._prune_values(directory)
+            if changed:
+                logger.info(f"Znovu načítaný katalóg {locale}, zmenených kľúčov: {len(changed)}")
+                changes[locale] = changed
+        return changes
+
+    def subscribe(self, translations_dir: str, service: "LocalizationService") -> None:
+        """Služba dostane oznámenie o zmenených katalógoch priečinka"""
+        directory = os.path.abspath(translations_dir)
+        with self._lock:
+            self._subscribers.setdefault(directory, weakref.WeakSet()).add(service)
+
+    def watch(self, translations_dir: str, interval: float = 1.0) -> None:
+        """Spustí sledovanie zmien súborov (mtime polling) vo vlákne na pozadí"""
+        directory = os.path.abspath(translations_dir)
+        with self._lock:
+            if directory in self._watchers:
+                return
+            stop = self._watchers[directory] = threading.Event()
+        threading.Thread(
+            target=self._watch_loop,
+            args=(directory, interval, stop),
+            name=f"l10n-watch-{os.path.basename(directory)}",
+            daemon=True
+        ).start()
+
+    def unwatch(self, translations_dir: str) -> None:
+        """Zastaví sledovanie zmien súborov priečinka"""
+        with self._lock:
+            stop = self._watchers.pop(os.path.abspath(translations_dir), None)
+        if stop is not None:
+            stop.set()
+
+    def _watch_loop(self, directory: str, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            try:
+                changes = self.refresh(directory)
+                if not changes:
+                    continue
+                with self._lock:
+                    services = list(self._subscribers.get(directory, ()))
+                for service in services:
+                    service._catalogs_changed(changes)
+            except Exception as e:
+                logger.error(f"Chyba pri sledovaní prekladov: {str(e)}")
+
+    def _drop_lookups(self, directory: str, locale: str) -> None:
+        """Zahodí zlúčené tabuľky, ktoré obsahujú daný katalóg"""
+        locale, namespace = split_catalog_id(locale)
+        for key in [
+            key for key in self._lookups
+            if key[0] == directory and locale in key[1]
+            and (namespace is None or namespace in key[2])
+        ]:
+            del self._lookups[key]
+
+    def _evict(self) -> None:
+        """Uvoľní najdlhšie nepoužité katalógy nad limitom max_catalogs"""
+        if self.max_catalogs is None:
+            return
+        evicted = set()
+        while len(self._catalogs) > self.max_catalogs:
+            (directory, locale), _ = self._catalogs.popitem(last=False)
+            self._mtimes.pop((directory, locale), None)
+            self._drop_lookups(directory, locale)
+            evicted.add(directory)
+            logger.debug(f"Uvoľnený katalóg z pamäte: {locale}")
+        for directory in evicted:
+            self._prune_values(directory)
+
+    def _prune_values(self, directory: str) -> None:
+        """Pool hodnôt kompaktných katalógov zúži na katalógy, ktoré ostali v pamäti"""
+        table = self._key_tables.get(directory)
+        if table is None:
+            return
+        table.retain_values(
+            catalog for (path, _), catalog in self._catalogs.items()
+            if path == directory and isinstance(catalog, CompactCatalog)
+        )
+
+    def _load(self, translations_dir: str, locale: str) -> Mapping[str, str]:
+        catalog = self._read(translations_dir, locale)
+        # Menné priestory sú malé a riedke, v tabuľke ID by zaberali pole
+        # veľké ako hlavný katalóg - ostávajú slovníkom
+        if self.compact and not isinstance(catalog, BinaryCatalog) and split_catalog_id(locale)[1] is None:
+            return CompactCatalog(self.key_table(translations_dir), catalog)
+        return catalog
+
+    def _source_mtime(self, translations_dir: str, locale: str) -> Optional[float]:
+        return self.backend(translations_dir).source_mtime(translations_dir, locale)
+
+    def _read(self, translations_dir: str, locale: str) -> Mapping[str, str]:
+        """Katalóg jazyka alebo menného priestoru, vnorené sekcie zploštené"""
+        catalog = self.backend(translations_dir).read(translations_dir, locale)
+        if catalog is None:
+            logger.warning(f"Chýbajúci prekladový súbor pre jazyk: {locale}")
+            return MappingProxyType({})
+        return catalog
+
+# Spoločný store pre všetky session v procese
+shared_catalogs = CatalogStore()
+
+# Pool vlákien pre načítanie katalógov na pozadí, vytvorí sa až pri prvom použití
+_loader: Optional["ThreadPoolExecutor"] = None
+_loader_lock = threading.Lock()
+
+def _catalog_loader() -> "ThreadPoolExecutor":
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _loader = ThreadPoolExecutor(max_workers=4, thread_name_prefix="l10n-loader")
+    return _loader
+
+def _log_preload_error(locale: str, future: "Future") -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Chyba pri načítaní jazyka {locale} na pozadí: {str(future.exception())}")
+
+class LocalizationService:
+    # Konfigurácia zdieľaná medzi službou a jej session handle
+    _SHARED_ATTRS = (
+        "translations_dir",
+        "fallback_locale",
+        "catalog_store",
+        "batch_updates",
+        "switch_debounce",
+        "supported_locales",
+        "catalog_backend",
+    )
+
+    def __init__(
+        self, 
+        translations_dir: str = "translations",
+        fallback_locale: str = "en",
+        default_locale: str = "en",
+        batch_updates: bool = True,
+        catalog_store: Optional[CatalogStore] = None,
+        switch_debounce: float = 0.0,
+        catalog_backend: Optional[CatalogBackend] = None
+    ):
+        self.translations_dir = translations_dir
+        self.current_locale = default_locale
+        self.fallback_locale = fallback_locale
+        # Katalógy sú zdieľané medzi session, per-session je iba jazyk a listenery
+        self.catalog_store = catalog_store or shared_catalogs
+        # Formát katalógov (JSON, gettext ...) sa nastaví pre priečinok v store
+        if catalog_backend is not None:
+            self.catalog_store.set_backend(translations_dir, catalog_backend)
+        self.catalog_backend = self.catalog_store.backend(translations_dir)
+        # Dávkový režim: komponenty počas notifikácie iba označia svoju stránku
+        # a na konci sa vykoná jeden page.update() pre každú stránku
+        self.batch_updates = batch_updates
+        # Rýchle po sebe idúce prepnutia v tomto okne (sekundy) sa zlúčia do jedného
+        self.switch_debounce = switch_debounce
+        self._init_session_state()
+        
+        self.supported_locales = {
+            "en": LocaleInfo("en", "English", TextDirection.LTR, "🇬🇧"),
+            "sk": LocaleInfo("sk", "Slovenčina", TextDirection.LTR, "🇸🇰"),
+            "cs": LocaleInfo("cs", "Čeština", TextDirection.LTR, "🇨🇿"),
+            # "de": LocaleInfo("de", "Deutsch", TextDirection.LTR, "🇩🇪"),
+            # "fr": LocaleInfo("fr", "Français", TextDirection.LTR, "🇫🇷"),
+            # "es": LocaleInfo("es", "Español", TextDirection.LTR, "🇪🇸"),
+            # "it": LocaleInfo("it", "Italiano", TextDirection.LTR, "🇮🇹"),
+            # "pt": LocaleInfo("pt", "Português", TextDirection.LTR, "🇵🇹")
+        }
+
+        # Validácia jazykov
+        self._validate_locales()
+        self._load_translations()
+
+    def _init_session_state(self) -> None:
+        """Stav, ktorý patrí jednej session (jazyk sa nastavuje zvlášť)"""
+        # Zlúčená tabuľka prekladov pre aktívny jazyk (current → fallback → en)
+        self._lookup: Mapping[str, str] = {}
+        # Menné priestory načítané pre túto session (zoradené)
+        self._namespaces: Tuple[str, ...] = ()
+        # Register listenerov cez slabé referencie, mŕtve komponenty sa odstránia samé
+        self._listeners: Dict[Tuple[int, Any], Callable[[], Optional[Callable[[], None]]]] = {}
+        # RLock - prune callback slabej referencie môže prísť z GC počas držania zámku
+        self._listeners_lock = threading.RLock()
+        # Vlákno, ktoré práve obnovuje komponenty (dávkový update)
+        self._notifying_thread: Optional[int] = None
+        self._pending_pages: Dict[int, Any] = {}
+        self._watching = False
+        self._stats: Optional[LocalizationStats] = None
+        # Živé session handle tejto služby (slabo)
+        self._sessions: "weakref.WeakSet[LocalizationService]" = weakref.WeakSet()
+        self._sessions_lock = threading.RLock()
+        # Každé prepnutie zvýši generáciu, bežiaca notifikácia staršej generácie skončí
+        self._switch_generation = 0
+        self._refresh_complete = True
+        self._pending_locale: Optional[str] = None
+        # Počet asynchrónnych prepnutí, ktoré ešte načítavajú katalógy
+        self._pending_loads = 0
+        self._switch_timer: Optional[threading.Timer] = None
+        self._switch_lock = threading.Lock()
+        # Jazyk a tabuľka sa menia iba pod týmto zámkom, obnova tak vidí jeden
+        # konzistentný stav; get() zámok nepotrebuje
+        self._refresh_lock = threading.RLock()
+
+    def session(self, locale: Optional[str] = None) -> "LocalizationService":
+        """Ľahký handle pre jednu používateľskú session
+
+        Zdieľa konfiguráciu a katalógy tejto služby, vlastný má iba jazyk
+        a listenery - prepnutie jazyka neobnovuje komponenty iných session.
+        """
+        locale = locale or self.current_locale
+        if locale not in self.supported_locales:
+            raise ValueError(f"Neplatný default locale: {locale}")
+
+        handle = object.__new__(type(self))
+        for attr in self._SHARED_ATTRS:
+            setattr(handle, attr, getattr(self, attr))
+        handle._init_session_state()
+        handle.current_locale = locale
+        handle._rebuild_lookup()
+        if self._watching:
+            handle._subscribe()
+        with self._sessions_lock:
+            # Zapnutie merania neskôr sa dostane aj do živých session
+            self._sessions.add(handle)
+            if self._stats is not None:
+                # Session zapisujú do spoločných štatistík služby
+                handle.enable_instrumentation(stats=self._stats)
+        return handle
+
+    def _validate_locales(self):
+        """Kontrola existencie fallback a default jazyka"""
+        if self.fallback_locale not in self.supported_locales:
+            raise ValueError(f"Neplatný fallback locale: {self.fallback_locale}")
+        if self.current_locale not in self.supported_locales:
+            raise ValueError(f"Neplatný default locale: {self.current_locale}")
+        if "en" not in self.supported_locales:
+            raise ValueError("Základný jazyk 'en' musí byť vždy prítomný")
+
+    def _load_translations(self) -> None:
+        """Načíta iba katalógy aktuálneho jazyka, ostatné až pri prvom prepnutí"""
+        try:
+            os.makedirs(self.translations_dir, exist_ok=True)
+            self._rebuild_lookup()
+        except Exception as e:
+            logger.error(f"Chyba pri načítaní prekladov: {str(e)}")
+            raise
+
+    @property
+    def translations(self) -> Dict[str, Mapping[str, str]]:
+        """Katalógy, ktoré sú momentálne načítané"""
+        return self.catalog_store.resident(self.translations_dir)
+
+    def watch_translations(self, interval: float = 1.0) -> None:
+        """Zapne hot-reload - zmenené súbory sa načítajú bez reštartu session"""
+        self._subscribe()
+        self.catalog_store.watch(self.translations_dir, interval)
+
+    def _subscribe(self) -> None:
+        self._watching = True
+        self.catalog_store.subscribe(self.translations_dir, self)
+
+    def _catalogs_changed(self, changes: Dict[str, Set[str]]) -> None:
+        """Obnoví tabuľku prekladov a komponenty so zmenenými kľúčmi"""
+        keys: Set[str] = set()
+        for locale in self._fallback_chain(self.current_locale):
+            for cid in self._catalog_ids(locale):
+                keys |= changes.get(cid, set())
+        if not keys:
+            return
+        with self._refresh_lock:
+            self._lookup = self._lookup_for(self.current_locale)
+            self._notify(keys, self._switch_generation)
+
+    def reload_translations(self) -> None:
+        """Znovu načíta prekladové súbory a obnoví UI"""
+        self.catalog_store.invalidate(self.translations_dir)
+        with self._refresh_lock:
+            self._load_translations()
+            self._notify(None, self._switch_generation)
+
+    def _fallback_chain(self, locale: str) -> List[str]:
+        """Poradie jazykov pre vyhľadávanie prekladu"""
+        return list(
+            dict.fromkeys([  # Odstráni duplicity zachovaním poradia
+                locale,
+                self.fallback_locale,
+                "en"
+            ])
+        )
+
+    def _catalog_ids(self, locale: str) -> List[str]:
+        """ID katalógov jazyka - načítané menné priestory a hlavný katalóg"""
+        return [catalog_id(locale, namespace) for namespace in (*self._namespaces, None)]
+
+    def _lookup_for(self, locale: str, namespaces: Optional[Tuple[str, ...]] = None) -> Mapping[str, str]:
+        """Zdieľaná tabuľka prekladov jazyka, katalógy sa načítajú podľa potreby"""
+        return self.catalog_store.lookup(
+            self.translations_dir,
+            tuple(self._fallback_chain(locale)),
+            self._namespaces if namespaces is None else namespaces
+        )
+
+    def load_namespaces(self, *namespaces: str) -> None:
+        """Pridá do session menné priestory (translations/<locale>/<namespace>.json)
+
+        Načítajú sa iba katalógy aktuálneho poradia jazykov, ostatné sekcie
+        sa neparsujú. Kľúče menného priestoru majú tvar "<namespace>.<kľúč>".
+        """
+        with self._refresh_lock:
+            loaded = tuple(sorted(set(self._namespaces).union(namespaces)))
+            if loaded == self._namespaces:
+                return
+            # Tabuľku zostavíme pred zmenou stavu, chyba nezanechá polovičný stav
+            lookup = self._lookup_for(self.current_locale, loaded)
+            added = set(loaded) - set(self._namespaces)
+            self._namespaces = loaded
+            self._lookup = lookup
+            if self._listeners:
+                # Komponenty vytvorené pred načítaním zobrazujú [kľúč]
+                self._notify({
+                    key for locale in self._fallback_chain(self.current_locale)
+                    for namespace in added
+                    for key in self.catalog_store.catalog(self.translations_dir, catalog_id(locale, namespace))
+                }, self._switch_generation)
+
+    @property
+    def namespaces(self) -> Tuple[str, ...]:
+        return self._namespaces
+
+    def _rebuild_lookup(self) -> None:
+        """Nastaví tabuľku prekladov pre aktuálny jazyk"""
+        self._lookup = self._lookup_for(self.current_locale)
+
+    def get(self, key: str, default: Optional[str] = None) -> str:
+        # Bez zámku - tabuľka sa nemení, prepnutie iba vymení referenciu
+        return self._lookup.get(key) or default or f"[{key}]"
+
+    def key_id(self, key: str) -> Optional[int]:
+        """Celočíselné ID kľúča (kompaktné katalógy), komponent si ho zistí raz"""
+        return self.catalog_store.key_id(self.translations_dir, key)
+
+    def get_by_id(self, key_id: int, key: str, default: Optional[str] = None) -> str:
+        """Preklad podľa ID kľúča, bez kompaktnej tabuľky podľa samotného kľúča"""
+        lookup = self._lookup
+        if self._stats is None:
+            if isinstance(lookup, CompactLookup):
+                return lookup.by_id(key_id) or default or f"[{key}]"
+            if isinstance(lookup, _NamespaceLookup):
+                return lookup.get_by_id(key_id, key) or default or f"[{key}]"
+        return self.get(key, default)
+
+    def enable_instrumentation(
+        self,
+        hook: Optional[StatsHook] = None,
+        stats: Optional[LocalizationStats] = None
+    ) -> LocalizationStats:
+        """Zapne počítadlá vyhľadávaní, chýbajúcich kľúčov a času notifikácií
+
+        Platí aj pre živé session tejto služby, tie zapisujú do tých istých štatistík.
+        """
+        with self._sessions_lock:
+            self._stats = stats or LocalizationStats(hook)
+            # Meraná verzia get() iba pre túto inštanciu, vypnutá nestojí nič
+            self.get = self._get_instrumented
+            for session in list(self._sessions):
+                session.enable_instrumentation(stats=self._stats)
+        return self._stats
+
+    def disable_instrumentation(self) -> None:
+        with self._sessions_lock:
+            self._stats = None
+            self.__dict__.pop("get", None)
+            for session in list(self._sessions):
+                session.disable_instrumentation()
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """Aktuálne štatistiky, prázdny slovník ak je meranie vypnuté"""
+        return self._stats.snapshot() if self._stats is not None else {}
+
+    def _get_instrumented(self, key: str, default: Optional[str] = None) -> str:
+        lookup = self._lookup
+        translation = lookup.get(key)
+        level = None
+        call_site = None
+        if translation:
+            for level, catalogs in enumerate(getattr(lookup, "levels", ())):
+                if any(catalog.get(key) for catalog in catalogs):
+                    break
+        else:
+            call_site = self._call_site()
+        if self._stats is not None:
+            self._stats.record_lookup(self.current_locale, key, level, call_site)
+        return translation or default or f"[{key}]"
+
+    @staticmethod
+    def _call_site() -> Optional[str]:
+        """Prvé miesto volania mimo balíka locales (napr. view, ktorý vytvoril komponent)"""
+        frame = sys._getframe(1)
+        while frame is not None and os.path.dirname(os.path.abspath(frame.f_code.co_filename)) == _PACKAGE_DIR:
+            frame = frame.f_back
+        if frame is None:
+            return None
+        return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+    def formatter(self, locale: Optional[str] = None) -> LocaleFormatter:
+        """Formátovač čísel, dátumov a mien jazyka (predvolene aktuálneho), zdieľaný v procese"""
+        return formatter_for(locale or self.current_locale)
+
+    def format(self, key: str, default: Optional[str] = None, **params: Any) -> str:
+        """Preklad s dosadenými parametrami, napr. '{name} sa prihlásil'"""
+        return self._render(self.get(key, default), params)
+
+    def plural(self, key: str, n: float, default: Optional[str] = None, **params: Any) -> str:
+        """Preklad v tvare množného čísla podľa n (kľúče key.one, key.few, key.other ...)"""
+        params.setdefault("count", n)
+        category = plural_category(self.current_locale, n)
+        template = (
+            self._lookup.get(f"{key}.{category}")
+            or self._lookup.get(f"{key}.other")
+            or self.get(key, default)
+        )
+        return self._render(template, params)
+
+    def _render(self, template: str, params: Dict[str, Any]) -> str:
+        if not params:
+            return template
+        try:
+            return compile_template(template).render(params)
+        except ValueError as e:
+            logger.error(f"Neplatná šablóna prekladu '{template}': {str(e)}")
+            return template
+
+    def switch_locale(self, locale: str) -> None:
+        if locale not in self.supported_locales:
+            logger.error(f"Pokus o prepnutie na nepodporovaný jazyk: {locale}")
+            return
+
+        if self.switch_debounce > 0:
+            self._schedule_switch(locale)
+            return
+
+        if self._skip_noop_switch(locale):
+            return
+        # Katalógy načítame pred zmenou jazyka, chyba nezanechá polovičný stav
+        self._apply_switch(locale, self._lookup_for(locale))
+
+    async def switch_locale_async(self, locale: str) -> None:
+        """Prepne jazyk, katalógy sa načítajú mimo event loopu"""
+        if locale not in self.supported_locales:
+            logger.error(f"Pokus o prepnutie na nepodporovaný jazyk: {locale}")
+            return
+
+        import asyncio  # Iba pre async režim, import je drahý
+
+        # Generácia sa zaberie pred načítaním - novšie prepnutie toto zruší,
+        # aj keď jeho katalógy budú načítané skôr
+        generation = self._next_generation()
+        with self._switch_lock:
+            self._pending_loads += 1
+        try:
+            loop = asyncio.get_running_loop()
+            lookup = await loop.run_in_executor(_catalog_loader(), self._lookup_for, locale)
+        finally:
+            with self._switch_lock:
+                self._pending_loads -= 1
+        if generation != self._switch_generation:
+            return  # Medzitým prebehlo novšie prepnutie
+        if self._is_noop_switch(locale):
+            return
+        self._apply_switch(locale, lookup, generation)
+
+    def _is_noop_switch(self, locale: str) -> bool:
+        """Prepnutie na aktuálny, úplne obnovený jazyk nerobí nič"""
+        return locale == self.current_locale and self._refresh_complete
+
+    def _skip_noop_switch(self, locale: str) -> bool:
+        """True pre prepnutie bez účinku, to však zruší staršie async prepnutia"""
+        if not self._is_noop_switch(locale):
+            return False
+        if self._pending_loads:
+            # Posledná voľba používateľa je aktuálny jazyk, načítavaný jazyk sa nepoužije
+            self._next_generation()
+        return True
+
+    def _apply_switch(self, locale: str, lookup: Mapping[str, str], generation: Optional[int] = None) -> None:
+        # Bežiaca obnova v inom vlákne skončí pri najbližšom listeneri a uvoľní zámok
+        if generation is None:
+            generation = self._next_generation()
+        with self._refresh_lock:
+            if generation != self._switch_generation:
+                return  # Kým sme čakali, prišlo novšie prepnutie
+            self._refresh_complete = False
+            self.current_locale = locale
+            self._lookup = lookup
+            if self._notify(None, generation):
+                self._refresh_complete = True
+
+    def _next_generation(self) -> int:
+        with self._switch_lock:
+            self._switch_generation += 1
+            return self._switch_generation
+
+    def _schedule_switch(self, locale: str) -> None:
+        """Odloží prepnutie, ďalšia požiadavka v okne nahradí predchádzajúcu"""
+        with self._switch_lock:
+            self._pending_locale = locale
+            if self._switch_timer is not None:
+                self._switch_timer.cancel()
+            self._switch_timer = threading.Timer(self.switch_debounce, self._flush_switch)
+            self._switch_timer.daemon = True
+            self._switch_timer.start()
+
+    def _flush_switch(self) -> None:
+        with self._switch_lock:
+            locale = self._pending_locale
+            self._pending_locale = None
+            self._switch_timer = None
+        if locale is None or self._skip_noop_switch(locale):
+            return
+        try:
+            self._apply_switch(locale, self._lookup_for(locale))
+        except Exception as e:
+            logger.error(f"Chyba pri prepnutí jazyka {locale}: {str(e)}")
+
+    def preload(self, locales: Optional[Iterable[str]] = None) -> List["Future"]:
+        """Načíta katalógy jazykov (predvolene všetkých) na pozadí"""
+        futures = []
+        for locale in self.supported_locales if locales is None else locales:
+            if locale not in self.supported_locales:
+                logger.warning(f"Preload nepodporovaného jazyka: {locale}")
+                continue
+            future = _catalog_loader().submit(self._lookup_for, locale)
+            # Chyba načítania sa inak stratí, ak volajúci future zahodí
+            future.add_done_callback(lambda f, locale=locale: _log_preload_error(locale, f))
+            futures.append(future)
+        return futures
+        
+    @staticmethod
+    def _listener_key(listener: Callable[[], None]) -> Tuple[int, Any]:
+        """Kľúč listenera - bound metóda je daná objektom a funkciou"""
+        if hasattr(listener, "__self__") and hasattr(listener, "__func__"):
+            return (id(listener.__self__), listener.__func__)
+        return (id(listener), None)
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        key = self._listener_key(listener)
+        if key[1] is not None:
+            # Bound metódu držíme slabo, aby listener nedržal komponent pri živote
+            def prune(ref: weakref.WeakMethod, key: Tuple[int, Any] = key) -> None:
+                with self._listeners_lock:
+                    if self._listeners.get(key) is ref:
+                        del self._listeners[key]
+
+            ref = weakref.WeakMethod(listener, prune)
+        else:
+            # Funkcie a lambdy nemajú iného vlastníka, preto ich držíme silno
+            ref = lambda: listener
+        with self._listeners_lock:
+            self._listeners.setdefault(key, ref)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        with self._listeners_lock:
+            self._listeners.pop(self._listener_key(listener), None)
+
+    @property
+    def listeners(self) -> List[Callable[[], None]]:
+        """Snímka živých listenerov, registrácie počas obnovy ju nemenia"""
+        with self._listeners_lock:
+            refs = list(self._listeners.values())
+        return [listener for listener in (ref() for ref in refs) if listener is not None]
+
+    @staticmethod
+    def _uses_keys(listener: Callable[[], None], keys: Set[str]) -> bool:
+        """Listener bez informácie o kľúčoch sa obnoví vždy"""
+        owner_keys = getattr(getattr(listener, "__self__", None), "localization_keys", None)
+        if owner_keys is None:
+            return True
+        used = owner_keys()
+        return used is None or not used.isdisjoint(keys)
+
+    def listener_count(self) -> int:
+        """Počet registrovaných listenerov (diagnostika)"""
+        return len(self._listeners)
+
+    def request_update(self, control: Any) -> bool:
+        """Zaradí stránku komponentu do dávkového update, mimo dávky vráti False"""
+        # Iba komponenty obnovované v tomto vlákne, update() z iných vlákien ide hneď
+        if self._notifying_thread != threading.get_ident():
+            return False
+        page = control.page
+        self._pending_pages[id(page)] = page
+        return True
+
+    def notify_listeners(self, keys: Optional[Set[str]] = None) -> bool:
+        """Obnoví komponenty, pri zadaných keys iba tie, ktoré ich používajú
+
+        Vráti False, ak obnovu prerušilo novšie prepnutie jazyka.
+        """
+        with self._refresh_lock:
+            return self._notify(keys, self._switch_generation)
+
+    def _notify(self, keys: Optional[Set[str]], generation: int) -> bool:
+        """Obnova nad snímkou listenerov, volá sa pod _refresh_lock"""
+        listeners = self.listeners
+        if keys is not None:
+            listeners = [
+                listener for listener in listeners
+                if self._uses_keys(listener, keys)
+            ]
+        stats = self._stats
+        start = time.perf_counter() if stats is not None else 0.0
+        by_class: Dict[str, float] = {}
+
+        completed = True
+        if not self.batch_updates:
+            completed = self._call_listeners(listeners, generation, by_class if stats is not None else None)
+        else:
+            pages = []
+            outer = self._notifying_thread
+            self._notifying_thread = threading.get_ident()
+            try:
+                completed = self._call_listeners(listeners, generation, by_class if stats is not None else None)
+            finally:
+                self._notifying_thread = outer
+                # Prerušená obnova nechá stránky čakať, odošle ich novšie prepnutie
+                if completed:
+                    pages = list(self._pending_pages.values())
+                    self._pending_pages.clear()
+
+            # Jeden round-trip na stránku namiesto update() každého komponentu
+            for page in pages:
+                page.update()
+
+        if stats is not None:
+            stats.record_notify(self.current_locale, time.perf_counter() - start, by_class)
+        return completed
+
+    def _call_listeners(
+        self,
+        listeners: List[Callable[[], None]],
+        generation: int,
+        by_class: Optional[Dict[str, float]] = None
+    ) -> bool:
+        """Zavolá listenery, pri zapnutom meraní sčíta čas podľa triedy komponentu
+
+        Skončí predčasne (False), ak medzitým začalo novšie prepnutie jazyka.
+        """
+        if by_class is None:
+            for listener in listeners:
+                if self._switch_generation != generation:
+                    return False
+                listener()
+            return True
+
+        for listener in listeners:
+            if self._switch_generation != generation:
+                return False
+            start = time.perf_counter()
+            listener()
+            name = type(getattr(listener, "__self__", listener)).__name__
+            by_class[name] = by_class.get(name, 0.0) + time.perf_counter() - start
+        return True
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Optional
+
+@dataclass(frozen=True)
+class FormatRules:
+    decimal: str
+    group: str
+    # Polia {day}, {month}, {year}
+    date_pattern: str
+    # Polia {sign}, {amount}, {symbol}
+    currency_pattern: str
+
+# Nezlomiteľná medzera - suma ani číslo sa nerozdelia na dva riadky
+_NBSP = "\u00a0"
+
+FORMAT_RULES: Dict[str, FormatRules] = {
+    "en": FormatRules(".", ",", "{month}/{day}/{year}", "{sign}{symbol}{amount}"),
+    "sk": FormatRules(",", _NBSP, "{day}. {month}. {year}", f"{{sign}}{{amount}}{_NBSP}{{symbol}}"),
+    "cs": FormatRules(",", _NBSP, "{day}. {month}. {year}", f"{{sign}}{{amount}}{_NBSP}{{symbol}}"),
+    "de": FormatRules(",", ".", "{day:02d}.{month:02d}.{year}", f"{{sign}}{{amount}}{_NBSP}{{symbol}}"),
+    "fr": FormatRules(",", _NBSP, "{day:02d}/{month:02d}/{year}", f"{{sign}}{{amount}}{_NBSP}{{symbol}}"),
+    "es": FormatRules(",", ".", "{day}/{month}/{year}", f"{{sign}}{{amount}}{_NBSP}{{symbol}}"),
+    "it": FormatRules(",", ".", "{day}/{month}/{year}", f"{{sign}}{{amount}}{_NBSP}{{symbol}}"),
+    "pt": FormatRules(",", ".", "{day:02d}/{month:02d}/{year}", f"{{sign}}{{symbol}}{_NBSP}{{amount}}"),
+}
+
+CURRENCY_SYMBOLS: Dict[str, str] = {
+    "EUR": "€",
+    "USD": "$",
+    "GBP": "£",
+    "CZK": "Kč",
+}
+
+class LocaleFormatter:
+    """Formátovanie čísel, dátumov a mien jedného jazyka, pravidlá sa pripravia raz"""
+    __slots__ = ("locale", "rules", "_separators")
+
+    def __init__(self, locale: str, rules: FormatRules):
+        self.locale = locale
+        self.rules = rules
+        # Python formátuje s "," a ".", na oddeľovače jazyka ich zmení jeden translate
+        self._separators = str.maketrans({",": rules.group, ".": rules.decimal})
+
+    def number(self, value: float, decimals: Optional[int] = None) -> str:
+        text = f"{value:,}" if decimals is None else f"{value:,.{decimals}f}"
+        return text.translate(self._separators)
+
+    def currency(self, amount: float, currency: str = "EUR", decimals: int = 2) -> str:
+        return self.rules.currency_pattern.format(
+            sign="-" if amount < 0 else "",
+            amount=self.number(abs(amount), decimals),
+            symbol=CURRENCY_SYMBOLS.get(currency, currency)
+        )
+
+    def date(self, value: date) -> str:
+        return self.rules.date_pattern.format(day=value.day, month=value.month, year=value.year)
+
+@lru_cache(maxsize=None)
+def formatter_for(locale: str) -> LocaleFormatter:
+    """Zdieľaný formátovač jazyka, neznámy jazyk použije pravidlá en"""
+    return LocaleFormatter(locale, FORMAT_RULES.get(locale, FORMAT_RULES["en"]))
@@ -0,0 +1,255 @@
+import ast
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+
+from .backends import CatalogBackend
+from .binary_catalog import BinaryCatalog
+from .nested import SEPARATOR, split_catalog_id
+
+logger = logging.getLogger(__name__)
+
+# Formát GNU .mo: hlavička (magic, verzia, počet, offset tabuľky msgid,
+# offset tabuľky prekladov, veľkosť a offset hash tabuľky), tabuľky dvojíc
+# (dĺžka, offset) zoradené podľa msgid a reťazce ukončené nulou
+LE_MAGIC = 0x950412de
+MO_EXTENSION = ".mo"
+
+_HEADER = struct.Struct("<7I")
+_PAIR = struct.Struct("<II")
+# Hlavička katalógu - bez nej by modul gettext dekódoval texty ako ASCII.
+# X-Generator odlíši .mo z write_mo od .mo z msgfmt a iných nástrojov
+_GENERATOR = "X-Generator: locales.gettext_catalog\n"
+_MO_METADATA = f"Content-Type: text/plain; charset=UTF-8\n{_GENERATOR}"
+
+# Kompilácia jedného .po naraz - súbežné vlákna by ho parsovali zbytočne
+_compile_locks: Dict[str, threading.Lock] = {}
+_compile_locks_lock = threading.Lock()
+
+def mo_path(po_path: str) -> str:
+    """Cesta ku skompilovanému .mo pre .po súbor"""
+    return os.path.splitext(po_path)[0] + MO_EXTENSION
+
+def _unquote(text: str, path: str, number: int) -> str:
+    # Väčšina reťazcov nemá escape sekvencie, literal_eval je pomalý
+    if len(text) >= 2 and text[0] == text[-1] == '"' and "\\" not in text and '"' not in text[1:-1]:
+        return text[1:-1]
+    try:
+        value = ast.literal_eval(text)
+    except (SyntaxError, ValueError):
+        value = None
+    if not isinstance(value, str):
+        raise ValueError(f"{path}:{number}: neplatný reťazec {text}")
+    return value
+
+def parse_po(path: str, prefix: str = "") -> Dict[str, str]:
+    """Preložené správy z .po súboru (UTF-8), bez hlavičky, fuzzy a nepreložených
+
+    msgctxt sa pripojí ako predpona kľúča ("menu" + "home" → "menu.home"),
+    pri msgid_plural sa použije msgstr[0]. Tvary množného čísla sa píšu ako
+    samostatné msgid (items_count.one, items_count.few ...), rovnako ako v JSON.
+    """
+    messages: Dict[str, str] = {}
+    entry: Dict[str, str] = {}
+    field: Optional[str] = None
+    fuzzy = False
+
+    def flush() -> None:
+        nonlocal entry, field, fuzzy
+        msgid = entry.get("msgid")
+        msgstr = entry.get("msgstr", entry.get("msgstr[0]"))
+        if msgid and msgstr and not fuzzy:
+            key = f"{entry['msgctxt']}{SEPARATOR}{msgid}" if "msgctxt" in entry else msgid
+            messages[f"{prefix}{SEPARATOR}{key}" if prefix else key] = msgstr
+        entry, field, fuzzy = {}, None, False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, raw in enumerate(f, 1):
+            line = raw.strip()
+            if not line:
+                continue
+            complete = any(name.startswith("msgstr") for name in entry)
+            if line.startswith("#"):
+                # Komentár začína ďalší záznam (#~ sú zastarané záznamy)
+                if complete:
+                    flush()
+                if line.startswith("#,") and "fuzzy" in line:
+                    fuzzy = True
+                continue
+            if line.startswith('"'):
+                if field is None:
+                    raise ValueError(f"{path}:{number}: reťazec mimo záznamu")
+                entry[field] += _unquote(line, path, number)
+                continue
+            keyword, _, text = line.partition(" ")
+            if not keyword.startswith(("msgctxt", "msgid", "msgstr")):
+                raise ValueError(f"{path}:{number}: neznámy riadok {line}")
+            if keyword in ("msgctxt", "msgid") and complete:
+                flush()
+            field = keyword
+            entry[field] = _unquote(text.strip(), path, number)
+    flush()
+    return messages
+
+def write_mo(messages: Mapping[str, str], output_path: str) -> str:
+    """Zapíše správy do .mo súboru (msgid zoradené podľa UTF-8 bajtov)"""
+    entries = sorted(
+        [("".encode('utf-8'), _MO_METADATA.encode('utf-8'))]
+        + [(key.encode('utf-8'), value.encode('utf-8')) for key, value in messages.items()]
+    )
+    count = len(entries)
+    originals_offset = _HEADER.size
+    translations_offset = originals_offset + _PAIR.size * count
+    offset = translations_offset + _PAIR.size * count
+
+    originals = bytearray()
+    translations = bytearray()
+    strings = bytearray()
+    for column, table in ((0, originals), (1, translations)):
+        for entry in entries:
+            text = entry[column]
+            table += _PAIR.pack(len(text), offset + len(strings))
+            strings += text + b"\0"
+
+    # Jedinečný dočasný súbor - kompilovať môžu naraz procesy aj vlákna
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(output_path)}.", suffix=".tmp",
+        dir=os.path.dirname(output_path) or "."
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(LE_MAGIC, 0, count, originals_offset, translations_offset, 0, offset))
+            f.write(originals)
+            f.write(translations)
+            f.write(strings)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_path
+
+def compile_po(po_path: str, output_path: Optional[str] = None, prefix: str = "") -> str:
+    """Skompiluje .po do .mo, vráti cestu k výstupu"""
+    return write_mo(parse_po(po_path, prefix), output_path or mo_path(po_path))
+
+def compile_directory(translations_dir: str) -> List[str]:
+    """Skompiluje všetky .po katalógy v priečinku vrátane menných priestorov"""
+    outputs = []
+    for name in sorted(os.listdir(translations_dir)):
+        path = os.path.join(translations_dir, name)
+        if name.endswith(".po"):
+            outputs.append(compile_po(path))
+        elif os.path.isdir(path):
+            outputs.extend(
+                compile_po(os.path.join(path, namespace), prefix=namespace[:-len(".po")])
+                for namespace in sorted(os.listdir(path))
+                if namespace.endswith(".po")
+            )
+    return outputs
+
+class MoCatalog(BinaryCatalog):
+    """Skompilovaný gettext katalóg nad mmap, msgid sa hľadajú binárne"""
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic = struct.unpack_from("<I", self._mm, 0)[0]
+        if magic == LE_MAGIC:
+            order = "<"
+        elif magic == struct.unpack("<I", struct.pack(">I", LE_MAGIC))[0]:
+            order = ">"
+        else:
+            self._mm.close()
+            raise ValueError(f"Neplatný .mo katalóg: {path}")
+        _, count, self._originals, self._translations = struct.unpack_from(f"{order}4I", self._mm, 4)
+        self._pair = struct.Struct(f"{order}II")
+        # Hlavička (prázdne msgid) je po zoradení prvá, medzi preklady nepatrí
+        self._first = 1 if count and self._pair.unpack_from(self._mm, self._originals)[0] == 0 else 0
+        self.path = path
+        self._count = count - self._first
+        # Katalóg z write_mo nemá kľúče s kontextom ani množným číslom v tvare GNU
+        self.generated = False
+        if self._first:
+            length, offset = self._pair.unpack_from(self._mm, self._translations)
+            self.generated = _GENERATOR.encode('utf-8') in self._mm[offset:offset + length]
+
+    def _entry(self, index: int):
+        index += self._first
+        key_length, key_offset = self._pair.unpack_from(self._mm, self._originals + index * _PAIR.size)
+        value_length, value_offset = self._pair.unpack_from(self._mm, self._translations + index * _PAIR.size)
+        return key_offset, key_length, value_offset, value_length
+
+    def gnu_messages(self) -> Optional[Dict[str, str]]:
+        """Správy s msgctxt alebo msgid_plural ako plochý slovník, None ak žiadne nie sú
+
+        Cudzie .mo kódujú kontext ako "ctxt\\x04msgid" a množné číslo ako
+        "msgid\\0msgid_plural" → "tvar0\\0tvar1". Binárne vyhľadanie také kľúče
+        nenájde - prevedú sa na "ctxt.msgid" a msgstr[0] ako pri parse_po.
+        """
+        mm = self._mm
+        entries = [self._entry(index) for index in range(self._count)]
+        raw_keys = [mm[key_offset:key_offset + key_length] for key_offset, key_length, _, _ in entries]
+        if not any(b"\x04" in raw or b"\0" in raw for raw in raw_keys):
+            return None
+        messages: Dict[str, str] = {}
+        for raw, (_, _, value_offset, value_length) in zip(raw_keys, entries):
+            key = raw.decode('utf-8').split("\0", 1)[0]
+            value = mm[value_offset:value_offset + value_length].decode('utf-8').split("\0", 1)[0]
+            if value:
+                messages[key.replace("\x04", SEPARATOR)] = value
+        return messages
+
+def _compile_lock(po_path: str) -> threading.Lock:
+    with _compile_locks_lock:
+        return _compile_locks.setdefault(os.path.abspath(po_path), threading.Lock())
+
+class GettextCatalogBackend(CatalogBackend):
+    """Katalógy gettext <locale>.po, skompilovaný .mo sa uloží vedľa zdroja
+
+    .po sa parsuje iba ak je .mo staršie, chýba alebo ho vytvoril iný
+    nástroj, inak sa .mo iba namapuje do pamäte - aj veľké katalógy sa
+    načítajú v milisekundách.
+    """
+    extension = ".po"
+
+    def read(self, translations_dir: str, catalog_id: str) -> Optional[Mapping[str, str]]:
+        po_path = self.source_path(translations_dir, catalog_id)
+        compiled = mo_path(po_path)
+        if not os.path.exists(po_path):
+            # Dodané iba skompilované .mo, napr. z iného nástroja
+            if not os.path.exists(compiled):
+                return None
+            catalog = MoCatalog(compiled)
+            messages = None if catalog.generated else catalog.gnu_messages()
+            if messages is None:
+                return catalog
+            return MappingProxyType(messages)
+
+        with _compile_lock(po_path):
+            # Po získaní zámku mohlo .mo skompilovať iné vlákno
+            if os.path.exists(compiled) and os.path.getmtime(compiled) >= os.path.getmtime(po_path):
+                catalog = MoCatalog(compiled)
+                if catalog.generated:
+                    return catalog
+                # .mo z msgfmt kóduje kontext a množné číslo inak - skompiluje sa z .po
+                del catalog
+            _, namespace = split_catalog_id(catalog_id)
+            messages = parse_po(po_path, namespace or "")
+            try:
+                write_mo(messages, compiled)
+            except OSError as e:
+                # Napr. priečinok iba na čítanie - preklady sa použijú bez cache
+                logger.warning(f"Nepodarilo sa uložiť {compiled}: {str(e)}")
+                return MappingProxyType(messages)
+            return MoCatalog(compiled)
+
+if __name__ == '__main__':
+    # python -m locales.gettext_catalog [translations_dir]
+    for output in compile_directory(sys.argv[1] if len(sys.argv) > 1 else "translations"):
+        print(output)
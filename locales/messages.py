@@ -0,0 +1,68 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+# Kategórie množného čísla podľa CLDR, kľúč tvaru je "<kľúč>.<kategória>"
+PLURAL_CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+# Pravidlá množného čísla podľa CLDR (zjednodušené na celé a desatinné čísla)
+def _plural_en(n: float) -> str:
+    return "one" if n == 1 else "other"
+
+def _plural_west_slavic(n: float) -> str:
+    """Slovenčina a čeština: 1 / 2–4 / 5+, desatinné čísla majú tvar many"""
+    if n != int(n):
+        return "many"
+    if n == 1:
+        return "one"
+    if 2 <= n <= 4:
+        return "few"
+    return "other"
+
+def _plural_fr(n: float) -> str:
+    return "one" if 0 <= n < 2 else "other"
+
+PLURAL_RULES: Dict[str, Callable[[float], str]] = {
+    "en": _plural_en,
+    "sk": _plural_west_slavic,
+    "cs": _plural_west_slavic,
+    "de": _plural_en,
+    "es": _plural_en,
+    "it": _plural_en,
+    "pt": _plural_fr,
+    "fr": _plural_fr,
+}
+
+def plural_category(locale: str, n: float) -> str:
+    """Kategória množného čísla (one/few/many/other) pre jazyk"""
+    return PLURAL_RULES.get(locale, _plural_en)(n)
+
+class MessageTemplate:
+    """Šablóna správy rozparsovaná raz, pri vykreslení sa iba dosadia parametre"""
+    __slots__ = ("parts",)
+
+    def __init__(self, template: str):
+        self.parts: Tuple[Tuple[str, Any, str, Any], ...] = tuple(Formatter().parse(template))
+
+    def render(self, params: Mapping[str, Any]) -> str:
+        out = []
+        for literal, field, spec, conversion in self.parts:
+            out.append(literal)
+            if field is None:
+                continue
+            if field not in params:
+                # Chýbajúci parameter ponecháme viditeľný v texte
+                out.append(f"{{{field}}}")
+                continue
+            value = params[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            out.append(format(value, spec) if spec else str(value))
+        return "".join(out)
+
+@lru_cache(maxsize=4096)
+def compile_template(template: str) -> MessageTemplate:
+    """Skompilovaná šablóna, rovnaký text sa parsuje iba raz za proces"""
+    return MessageTemplate(template)
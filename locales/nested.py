@@ -0,0 +1,26 @@
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Oddeľovač menných priestorov v kľúčoch, napr. "login.title"
+SEPARATOR = "."
+
+def flatten_catalog(data: Mapping[str, Any], prefix: str = "") -> Dict[str, str]:
+    """Vnorený katalóg {"login": {"title": ...}} na plochý {"login.title": ...}"""
+    flat: Dict[str, str] = {}
+    stack = [(prefix, data)]
+    while stack:
+        path, node = stack.pop()
+        for key, value in node.items():
+            full_key = f"{path}{SEPARATOR}{key}" if path else key
+            if isinstance(value, Mapping):
+                stack.append((full_key, value))
+            else:
+                flat[full_key] = value
+    return flat
+
+def split_catalog_id(catalog_id: str) -> Tuple[str, Optional[str]]:
+    """ID katalógu "sk/login" na jazyk a menný priestor, "sk" na ("sk", None)"""
+    locale, _, namespace = catalog_id.partition("/")
+    return locale, namespace or None
+
+def catalog_id(locale: str, namespace: Optional[str] = None) -> str:
+    return f"{locale}/{namespace}" if namespace else locale
@@ -0,0 +1,70 @@
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+# Hook dostane názov udalosti ("missing_key", "notify") a jej údaje
+StatsHook = Callable[[str, Dict[str, Any]], None]
+
+class LocalizationStats:
+    """Počítadlá lokalizácie - zapínajú sa iba na požiadanie"""
+    def __init__(self, hook: Optional[StatsHook] = None):
+        self.hook = hook
+        self._lock = threading.Lock()
+        self.lookups: Counter = Counter()
+        # Úroveň v reťazci: 0 = aktuálny jazyk, 1 = fallback, 2 = "en"
+        self.fallback_hits: Counter = Counter()
+        self.missing: Counter = Counter()
+        self.missing_first_seen: Dict[str, str] = {}
+        self.notify_count = 0
+        self.notify_seconds = 0.0
+        self.notify_by_class: Dict[str, float] = {}
+
+    def record_lookup(self, locale: str, key: str, level: Optional[int], call_site: Optional[str]) -> None:
+        first_seen = False
+        with self._lock:
+            self.lookups[locale] += 1
+            if level is not None:
+                self.fallback_hits[level] += 1
+            else:
+                self.missing[key] += 1
+                if key not in self.missing_first_seen:
+                    self.missing_first_seen[key] = call_site or "?"
+                    first_seen = True
+        if first_seen and self.hook is not None:
+            self.hook("missing_key", {"key": key, "locale": locale, "call_site": call_site})
+
+    def record_notify(self, locale: str, seconds: float, by_class: Dict[str, float]) -> None:
+        with self._lock:
+            self.notify_count += 1
+            self.notify_seconds += seconds
+            for name, class_seconds in by_class.items():
+                self.notify_by_class[name] = self.notify_by_class.get(name, 0.0) + class_seconds
+        if self.hook is not None:
+            self.hook("notify", {"locale": locale, "seconds": seconds, "by_class": by_class})
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Kópia aktuálnych hodnôt, vhodná na export"""
+        with self._lock:
+            return {
+                "lookups": dict(self.lookups),
+                "fallback_hits": dict(self.fallback_hits),
+                "missing": {
+                    key: {"count": count, "first_seen": self.missing_first_seen.get(key)}
+                    for key, count in self.missing.items()
+                },
+                "notify": {
+                    "count": self.notify_count,
+                    "seconds": self.notify_seconds,
+                    "by_class": dict(self.notify_by_class),
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.lookups.clear()
+            self.fallback_hits.clear()
+            self.missing.clear()
+            self.missing_first_seen.clear()
+            self.notify_count = 0
+            self.notify_seconds = 0.0
+            self.notify_by_class.clear()
@@ -0,0 +1,246 @@
+"""Kontrola prekladov - chýbajúce, nepoužité a nezhodné kľúče
+
+Spustenie z koreňa projektu:
+
+    python -m locales.validate --source . --translations translations
+    python -m locales.validate --json --fail-on-unused
+
+Návratové kódy: 0 bez chýb, 1 chýbajúce kľúče alebo nezhodné parametre,
+2 nepoužité kľúče (iba s --fail-on-unused).
+"""
+import argparse
+import ast
+import json
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .gettext_catalog import parse_po
+from .messages import PLURAL_CATEGORIES
+from .nested import flatten_catalog, split_catalog_id
+
+CATALOG_EXTENSIONS = (".json", ".po")
+SKIPPED_DIRS = {".git", "__pycache__", ".venv", "venv", "build", "dist", "node_modules"}
+
+def _placeholders(template: str) -> Optional[Tuple[str, ...]]:
+    """Mená parametrov v šablóne, None ak je šablóna neplatná"""
+    try:
+        return tuple(sorted({field for _, field, _, _ in Formatter().parse(template) if field}))
+    except ValueError:
+        return None
+
+def _string_arg(node: Optional[ast.AST]) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+def _call_name(node: ast.Call) -> str:
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return ""
+
+def scan_source(path: str) -> Tuple[str, List[Tuple[str, int]], Optional[str]]:
+    """Kľúče odovzdané Localized* konštruktorom v jednom súbore (key, riadok)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (SyntaxError, UnicodeDecodeError) as e:
+        return path, [], str(e)
+
+    usages: List[Tuple[str, int]] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not _call_name(node).startswith("Localized"):
+            continue
+        # LocalizedText(loc, "key") alebo text_key="key"
+        if len(node.args) > 1 and (key := _string_arg(node.args[1])) is not None:
+            usages.append((key, node.lineno))
+        for keyword in node.keywords:
+            if keyword.arg == "text_key" and (key := _string_arg(keyword.value)) is not None:
+                usages.append((key, keyword.value.lineno))
+        # Konfigurácie {"key": "..."} v destinations, items, options_config ...
+        for child in ast.walk(node):
+            if child is node or not isinstance(child, ast.Dict):
+                continue
+            for dict_key, value in zip(child.keys, child.values):
+                if _string_arg(dict_key) == "key" and (key := _string_arg(value)) is not None:
+                    usages.append((key, value.lineno))
+    return path, usages, None
+
+def load_catalog(
+    translations_dir: str,
+    catalog_id: str
+) -> Tuple[str, Dict[str, Optional[Tuple[str, ...]]], Optional[str]]:
+    """Kľúče katalógu (jazyk alebo jazyk/menný priestor) a parametre ich šablón"""
+    _, namespace = split_catalog_id(catalog_id)
+    path = os.path.join(translations_dir, catalog_id)
+    try:
+        if os.path.exists(f"{path}.json"):
+            with open(f"{path}.json", 'r', encoding='utf-8') as f:
+                catalog = flatten_catalog(json.load(f), namespace or "")
+        else:
+            catalog = parse_po(f"{path}.po", namespace or "")
+    except (OSError, ValueError, AttributeError) as e:
+        return catalog_id, {}, str(e)
+    return catalog_id, {
+        key: _placeholders(value) if isinstance(value, str) else None
+        for key, value in catalog.items()
+    }, None
+
+def _python_files(root: str) -> List[str]:
+    files = []
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = [name for name in dirs if name not in SKIPPED_DIRS and not name.startswith(".")]
+        files.extend(os.path.join(directory, name) for name in names if name.endswith(".py"))
+    return sorted(files)
+
+def _catalog_ids(translations_dir: str) -> List[str]:
+    """Katalógy jazykov (sk) a ich menných priestorov (sk/login), JSON alebo .po"""
+    ids: Dict[str, None] = {}
+    for name in sorted(os.listdir(translations_dir)):
+        path = os.path.join(translations_dir, name)
+        stem, extension = os.path.splitext(name)
+        if extension in CATALOG_EXTENSIONS:
+            ids[stem] = None
+        elif os.path.isdir(path):
+            for namespace in sorted(os.listdir(path)):
+                stem, extension = os.path.splitext(namespace)
+                if extension in CATALOG_EXTENSIONS:
+                    ids[f"{name}/{stem}"] = None
+    return list(ids)
+
+def _map(executor: Optional[Executor], func, items: List[str]) -> Iterable[Any]:
+    if executor is None:
+        return map(func, items)
+    # Väčšie dávky znižujú réžiu medzi procesmi pri tisícoch súborov
+    chunksize = max(1, len(items) // (4 * (os.cpu_count() or 1)))
+    return executor.map(func, items, chunksize=chunksize)
+
+def _base_key(key: str) -> str:
+    """Kľúč množného čísla items_count.few patrí ku kľúču items_count"""
+    base, _, suffix = key.rpartition(".")
+    return base if base and suffix in PLURAL_CATEGORIES else key
+
+def _comparable_placeholders(
+    entries: Dict[str, Optional[Tuple[str, ...]]]
+) -> Dict[str, Optional[Tuple[str, ...]]]:
+    """Parametre na porovnanie s referenčným jazykom
+
+    Tvary množného čísla sa porovnávajú spolu pod základným kľúčom - zjednotenie
+    ich parametrov (en "items.one": "One item" nemusí obsahovať {count}).
+    """
+    result: Dict[str, Optional[Tuple[str, ...]]] = {}
+    plural_bases = {_base_key(key) for key in entries if _base_key(key) != key}
+    for key, placeholders in entries.items():
+        base = _base_key(key)
+        if base not in plural_bases:
+            result[key] = placeholders
+        elif base in result and result[base] is None:
+            continue  # Neplatná šablóna niektorého tvaru
+        elif placeholders is None:
+            result[base] = None
+        else:
+            result[base] = tuple(sorted(set(result.get(base) or ()) | set(placeholders)))
+    return result
+
+def validate(
+    source_root: str,
+    translations_dir: str,
+    reference_locale: str = "en",
+    jobs: Optional[int] = None
+) -> Dict[str, Any]:
+    sources = _python_files(source_root)
+    catalog_ids = _catalog_ids(translations_dir)
+
+    workers = jobs if jobs is not None else os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        scanned = list(_map(executor, scan_source, sources))
+        loaded = list(_map(executor, partial(load_catalog, translations_dir), catalog_ids))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    errors = [f"{path}: {error}" for path, _, error in scanned if error]
+    errors += [f"{cid}: {error}" for cid, _, error in loaded if error]
+
+    used: Dict[str, str] = {}
+    for path, usages, _ in scanned:
+        for key, line in usages:
+            used.setdefault(key, f"{os.path.relpath(path, source_root)}:{line}")
+
+    # Menné priestory sa zlúčia do katalógu svojho jazyka
+    catalogs: Dict[str, Dict[str, Optional[Tuple[str, ...]]]] = {}
+    for cid, entries, error in loaded:
+        if not error:
+            catalogs.setdefault(split_catalog_id(cid)[0], {}).update(entries)
+    reference = _comparable_placeholders(catalogs.get(reference_locale, {}))
+
+    report: Dict[str, Any] = {"errors": errors, "locales": {}}
+    for locale, entries in catalogs.items():
+        present = set(entries) | {_base_key(key) for key in entries}
+        missing = {key: used[key] for key in sorted(used) if key not in present}
+        unused = sorted(key for key in entries if _base_key(key) not in used and key not in used)
+        mismatched = {}
+        for key, placeholders in _comparable_placeholders(entries).items():
+            if key not in reference:
+                continue
+            expected = reference[key]
+            if placeholders is None or expected is None or placeholders != expected:
+                mismatched[key] = {"expected": expected, "found": placeholders}
+        report["locales"][locale] = {
+            "missing": missing,
+            "unused": unused,
+            "placeholder_mismatch": mismatched,
+        }
+    return report
+
+def exit_code(report: Dict[str, Any], fail_on_unused: bool = False) -> int:
+    locales = report["locales"].values()
+    if report["errors"] or any(item["missing"] or item["placeholder_mismatch"] for item in locales):
+        return 1
+    if fail_on_unused and any(item["unused"] for item in locales):
+        return 2
+    return 0
+
+def print_report(report: Dict[str, Any]) -> None:
+    for error in report["errors"]:
+        print(f"CHYBA {error}")
+    for locale, item in sorted(report["locales"].items()):
+        print(
+            f"[{locale}] chýbajúce: {len(item['missing'])}, "
+            f"nepoužité: {len(item['unused'])}, "
+            f"nezhodné parametre: {len(item['placeholder_mismatch'])}"
+        )
+        for key, call_site in item["missing"].items():
+            print(f"  - chýba '{key}' ({call_site})")
+        for key, detail in item["placeholder_mismatch"].items():
+            print(f"  ! '{key}': očakávané {detail['expected']}, nájdené {detail['found']}")
+        for key in item["unused"]:
+            print(f"  ? nepoužitý '{key}'")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Kontrola pokrytia prekladov")
+    parser.add_argument("--source", default=".", help="koreň zdrojových súborov")
+    parser.add_argument("--translations", default="translations", help="priečinok s JSON alebo .po katalógmi")
+    parser.add_argument("--reference", default="en", help="jazyk, podľa ktorého sa kontrolujú parametre")
+    parser.add_argument("--jobs", type=int, help="počet procesov (1 = bez poolu)")
+    parser.add_argument("--json", action="store_true", help="výstup ako JSON")
+    parser.add_argument("--fail-on-unused", action="store_true", help="nepoužité kľúče vrátia kód 2")
+    args = parser.parse_args(argv)
+
+    report = validate(args.source, args.translations, args.reference, args.jobs)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        print_report(report)
+    return exit_code(report, args.fail_on_unused)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+
+from .core import LocalizationService
+from .widgets import LocalizedListView, LocalizedMixin
+
+class _CachedView:
+    __slots__ = ("view", "controls", "hidden_locale")
+
+    def __init__(self, view: Any, controls: List[Any]):
+        self.view = view
+        self.controls = controls
+        # Jazyk v čase skrytia, None ak je view zobrazené
+        self.hidden_locale: Optional[str] = None
+
+def localized_controls(root: Any) -> List[Any]:
+    """Komponenty stromu, ktoré sa registrujú ako listenery lokalizácie"""
+    found = []
+    stack = [root]
+    while stack:
+        control = stack.pop()
+        if control is None:
+            continue
+        if control is not root and hasattr(control, "localization") and hasattr(control, "update_localization"):
+            found.append(control)
+            if isinstance(control, LocalizedListView):
+                # Riadky zoznamu obnovuje samotný zoznam, nie sú listenermi
+                continue
+        # Lokalizované potomky môže mať aj lokalizovaný komponent (content tlačidla ...)
+        get_children = getattr(control, "_get_children", None)
+        if get_children is not None:
+            stack.extend(get_children())
+    return found
+
+class ViewCache:
+    """Cache Flet view podľa route - opakovaná navigácia nestavia view nanovo
+
+    Skryté view nedostávajú notifikácie o zmene jazyka. Pri opätovnom
+    zobrazení sa preložia iba ak sa jazyk medzitým zmenil. Najdlhšie
+    nepoužité view nad limitom max_views sa zahodia.
+    """
+    def __init__(self, localization: LocalizationService, max_views: int = 5):
+        self.localization = localization
+        self.max_views = max_views
+        self._views: "OrderedDict[str, _CachedView]" = OrderedDict()
+
+    def get(self, route: str, factory: Callable[[], Any]) -> Any:
+        """Vráti view pre route, pri prvom použití ho vytvorí cez factory"""
+        entry = self._views.get(route)
+        if entry is None:
+            view = factory()
+            self._views[route] = _CachedView(view, localized_controls(view))
+            self._evict()
+            return view
+
+        self._views.move_to_end(route)
+        if entry.hidden_locale is not None:
+            self._show(entry)
+        return entry.view
+
+    def hide_all(self) -> None:
+        """Odpojí všetky zobrazené view od notifikácií (pred page.views.clear())"""
+        for entry in self._views.values():
+            if entry.hidden_locale is None:
+                self._detach(entry)
+                entry.hidden_locale = self.localization.current_locale
+
+    def invalidate(self, route: Optional[str] = None) -> None:
+        """Zahodí view (alebo všetky), ďalšia navigácia ho postaví nanovo"""
+        routes = list(self._views) if route is None else [route]
+        for key in routes:
+            entry = self._views.pop(key, None)
+            if entry is not None:
+                self._detach(entry)
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def _show(self, entry: _CachedView) -> None:
+        locale_changed = entry.hidden_locale != self.localization.current_locale
+        entry.hidden_locale = None
+        for control in entry.controls:
+            self.localization.add_listener(control.update_localization)
+            if not locale_changed:
+                continue
+            # Bez update() - view sa odošle spolu s nasledujúcim page.update()
+            if isinstance(control, LocalizedMixin):
+                control._update_text()
+            elif isinstance(control, LocalizedListView):
+                control._generation += 1
+                control._refresh_window()
+            else:
+                control.update_localization()
+
+    def _detach(self, entry: _CachedView) -> None:
+        for control in entry.controls:
+            self.localization.remove_listener(control.update_localization)
+
+    def _evict(self) -> None:
+        while len(self._views) > self.max_views:
+            _, entry = self._views.popitem(last=False)
+            self._detach(entry)
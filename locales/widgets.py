@@ -0,0 +1,540 @@
+import flet as ft
+from typing import Dict, Optional, List, Any, Set
+import logging
+
+from .core import LocalizationService
+from .messages import PLURAL_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+class LocalizedMixin:
+    def __init__(
+        self,
+        localization: LocalizationService,
+        *args,
+        listen: bool = True,
+        lazy: bool = False,
+        **kwargs
+    ):
+        """
+        listen: False pre riadky LocalizedListView, ktoré obnovuje samotný zoznam
+        lazy: nepripojený komponent pri zmene jazyka iba označí text ako neaktuálny
+              a preloží ho až pred odoslaním na stránku
+        """
+        super().__init__(*args, **kwargs)
+        self.localization = localization
+        self.lazy = lazy
+        self._localization_stale = False
+        # ID kľúča sa zistí raz pri vytvorení (kompaktné katalógy)
+        text_key = getattr(self, "text_key", None)
+        self._key_id = localization.key_id(text_key) if text_key is not None else None
+        if listen:
+            self.localization.add_listener(self.update_localization)
+        
+    def update_localization(self) -> None:
+        if self.lazy and getattr(self, 'page', None) is None:
+            self._localization_stale = True
+            return
+
+        # Aktualizácia textu bez volania update()
+        if not self._update_text():
+            return  # Text sa nezmenil, komponent netreba posielať klientovi
+        
+        # Ak je komponent na stránke, vykonáme update (v dávke až na konci notifikácie)
+        if hasattr(self, 'page') and self.page is not None:
+            if not self.localization.request_update(self):
+                self.update()
+
+    def _update_text(self) -> bool:
+        """Aplikuje lokalizovaný text, vráti False ak sa nič nezmenilo"""
+        self._localization_stale = False
+        try:
+            # Použitie novej get() metódy s fallback
+            # None (implementácia bez návratovej hodnoty) považujeme za zmenu
+            return self._apply_localized_text() is not False
+        except Exception as e:
+            logger.error(f"Chyba pri aktualizácii textu: {str(e)}")
+            self.value = "L10N_ERROR"
+            return True
+
+    def _apply_localized_text(self):
+        """Abstraktná metóda pre aplikáciu lokalizovaného textu"""
+        raise NotImplementedError
+
+    def _localized_text(self) -> str:
+        """Text pre text_key s dosadenými parametrami (count určuje množné číslo)"""
+        params = getattr(self, "params", None)
+        if not params:
+            if self._key_id is not None:
+                return self.localization.get_by_id(self._key_id, self.text_key, self.default)
+            return self.localization.get(self.text_key, self.default)
+        if "count" in params:
+            return self.localization.plural(self.text_key, params["count"], self.default, **params)
+        return self.localization.format(self.text_key, self.default, **params)
+
+    def set_params(self, **params: Any) -> None:
+        """Zmení parametre textu a prekreslí komponent"""
+        self.params = {**(getattr(self, "params", None) or {}), **params}
+        self.update_localization()
+
+    def localization_keys(self) -> Optional[Set[str]]:
+        """Kľúče prekladov komponentu, None ak nie sú známe"""
+        text_key = getattr(self, "text_key", None)
+        if text_key is None:
+            return None
+        params = getattr(self, "params", None)
+        if params and "count" in params:
+            # plural() číta tvary text_key.one, text_key.few ...
+            return {text_key, *(f"{text_key}.{category}" for category in PLURAL_CATEGORIES)}
+        return {text_key}
+
+    def _set_if_changed(self, target: Any, attr: str, value: Any) -> bool:
+        """Nastaví atribút iba pri zmene hodnoty, vráti True ak sa zmenil"""
+        if getattr(target, attr, None) == value:
+            return False
+        setattr(target, attr, value)
+        return True
+
+    def _patch_labels(self, children: List[Any], configs: List[Dict[str, Any]], attr: str) -> bool:
+        """Aktualizuje popisky existujúcich potomkov na mieste namiesto ich prestavby"""
+        changed = False
+        for child, config in zip(children, configs):
+            label = self.localization.get(
+                config["key"],
+                config.get("default", f"[{config['key']}]")
+            )
+            changed |= self._set_if_changed(child, attr, label)
+        return changed
+
+    def before_update(self):
+        """Neaktuálny text (lazy režim) sa preloží pred odoslaním klientovi"""
+        if self._localization_stale:
+            self._update_text()
+        super().before_update()
+
+    def did_mount(self):
+        """Volá sa po pridaní komponentu na stránku"""
+        self._update_text()
+        super().did_mount()
+
+    def dispose(self):
+        self.localization.remove_listener(self.update_localization)
+        super().dispose()
+
+class LanguageSelector(ft.PopupMenuButton):
+    def __init__(self, localization: LocalizationService, preload_on_open: bool = False):
+        super().__init__()
+        self.localization = localization
+        self.localization.add_listener(self.update_localization) 
+        self.icon = ft.Icons.LANGUAGE
+        if preload_on_open:
+            # Voliteľné: pri otvorení menu sa zahrejú katalógy všetkých jazykov, klik už
+            # iba aplikuje hotový jazyk. Pri max_catalogs menšom ako počet jazykov vypnúť
+            self.on_open = lambda e: self.localization.preload()
+        self._update_items()
+
+    def update_localization(self) -> None:
+        self._update_items()
+
+    def _update_items(self) -> None:
+        self.items = [
+            ft.PopupMenuItem(
+                text=f"{info.flag_emoji} {info.name}",
+                data=locale,
+                on_click=lambda e: self.localization.switch_locale(e.control.data)
+            ) for locale, info in self.localization.supported_locales.items()
+        ]
+
+    def dispose(self):
+        self.localization.remove_listener(self.update_localization)
+        super().dispose()
+
+class LocalizedText(LocalizedMixin, ft.Text):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        text_key: str, 
+        default: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        self.text_key = text_key
+        self.default = default
+        self.params = params
+        super().__init__(localization=localization, **kwargs)
+        self._apply_localized_text()  # Pridané pre okamžitú inicializáciu
+
+    def _apply_localized_text(self) -> bool:
+        return self._set_if_changed(self, "value", self._localized_text())
+
+class LocalizedTextField(LocalizedMixin, ft.TextField):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        text_key: str, 
+        default: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        self.text_key = text_key
+        self.default = default
+        self.params = params
+        super().__init__(localization=localization, **kwargs)
+        self._apply_localized_text()
+    
+    def _apply_localized_text(self) -> bool:
+        return self._set_if_changed(self, "label", self._localized_text())
+
+class LocalizedPopupMenuButton(LocalizedMixin, ft.PopupMenuButton):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        items: List[Dict[str, Any]],
+        **kwargs
+    ):
+        self.menu_items = items
+        super().__init__(localization=localization, **kwargs)
+        self._rebuild_items()
+    
+    def localization_keys(self) -> Optional[Set[str]]:
+        return {item["key"] for item in self.menu_items}
+
+    def _rebuild_items(self):
+        self.items = [
+            ft.PopupMenuItem(
+                text=self.localization.get(
+                    item["key"], 
+                    item.get("default", f"[{item['key']}]")
+                ),
+                icon=item.get("icon"),
+                on_click=item["on_click"]
+            )
+            for item in self.menu_items
+        ]
+    
+    def _apply_localized_text(self) -> bool:
+        if len(self.items or []) != len(self.menu_items):
+            self._rebuild_items()
+            return True
+        return self._patch_labels(self.items, self.menu_items, "text")
+
+class LocalizedNavigationBar(LocalizedMixin, ft.NavigationBar):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        destinations: List[Dict[str, Any]],
+        **kwargs
+    ):
+        self.destinations_config = destinations
+        super().__init__(localization=localization, **kwargs)
+        self._rebuild_destinations()
+    
+    def localization_keys(self) -> Optional[Set[str]]:
+        return {dest["key"] for dest in self.destinations_config}
+
+    def _rebuild_destinations(self):
+        self.destinations = [
+            ft.NavigationBarDestination(
+                icon=dest["icon"],
+                label=self.localization.get(
+                    dest["key"], 
+                    dest.get("default", f"[{dest['key']}]")
+                )
+            )
+            for dest in self.destinations_config
+        ]
+    
+    def _apply_localized_text(self) -> bool:
+        if len(self.destinations or []) != len(self.destinations_config):
+            self._rebuild_destinations()
+            return True
+        return self._patch_labels(self.destinations, self.destinations_config, "label")
+
+class LocalizedNavigationDrawer(LocalizedMixin, ft.NavigationDrawer):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        destinations: List[Dict[str, Any]],
+        **kwargs
+    ):
+        self.destinations_config = destinations
+        super().__init__(localization=localization, **kwargs)
+        self._rebuild_destinations()
+    
+    def localization_keys(self) -> Optional[Set[str]]:
+        return {dest["key"] for dest in self.destinations_config}
+
+    def _rebuild_destinations(self):
+        self.controls = [
+            ft.NavigationDrawerDestination(
+                icon=dest["icon"],
+                label=self.localization.get(
+                    dest["key"], 
+                    dest.get("default", f"[{dest['key']}]")
+                )
+            )
+            for dest in self.destinations_config
+        ]
+    
+    def _apply_localized_text(self) -> bool:
+        if len(self.controls or []) != len(self.destinations_config):
+            self._rebuild_destinations()
+            return True
+        return self._patch_labels(self.controls, self.destinations_config, "label")
+
+class LocalizedTextButton(LocalizedMixin, ft.TextButton):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        text_key: str, 
+        default: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        self.text_key = text_key
+        self.default = default
+        self.params = params
+        super().__init__(localization=localization, **kwargs)
+        self._apply_localized_text()
+    
+    def _apply_localized_text(self) -> bool:
+        return self._set_if_changed(self, "text", self._localized_text())
+
+class LocalizedOutlinedButton(LocalizedMixin, ft.OutlinedButton):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        text_key: str, 
+        default: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        self.text_key = text_key
+        self.default = default
+        self.params = params
+        super().__init__(localization=localization, **kwargs)
+        self._apply_localized_text()
+    
+    def _apply_localized_text(self) -> bool:
+        return self._set_if_changed(self, "text", self._localized_text())
+
+class LocalizedElevatedButton(LocalizedMixin, ft.ElevatedButton):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        text_key: str, 
+        default: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        self.text_key = text_key
+        self.default = default
+        self.params = params
+        super().__init__(localization=localization, **kwargs)
+        self._apply_localized_text()
+    
+    def _apply_localized_text(self) -> bool:
+        return self._set_if_changed(self, "text", self._localized_text())
+
+class LocalizedDropdown(LocalizedMixin, ft.Dropdown):
+    def __init__(
+        self, 
+        localization: LocalizationService, 
+        label_config: Dict[str, Any],
+        options_config: List[Dict[str, Any]],
+        **kwargs
+    ):
+        """
+        Parametre:
+        label_config: {"key": "label_key", "default": "Default label"}
+        options_config: [{"key": "option1", "default": "Default 1"}, ...]
+        """
+        self.label_config = label_config
+        self.options_config = options_config
+        super().__init__(localization=localization, **kwargs)
+        self._rebuild_options()
+    
+    def localization_keys(self) -> Optional[Set[str]]:
+        return {self.label_config["key"]} | {opt["key"] for opt in self.options_config}
+
+    def _rebuild_options(self):
+        # Aktualizácia labelu
+        self.label = self.localization.get(
+            self.label_config["key"],
+            self.label_config.get("default", f"[{self.label_config['key']}]")
+        )
+        
+        # Aktualizácia options
+        self.options = [
+            ft.dropdown.Option(
+                text=self.localization.get(
+                    opt["key"],
+                    opt.get("default", f"[{opt['key']}]")
+                ),
+                key=opt["key"]
+            )
+            for opt in self.options_config
+        ]
+    
+    def update_label(self, new_label_config: Dict[str, Any]):
+        """Aktualizuje konfiguráciu labelu"""
+        self.label_config = new_label_config
+        self._rebuild_options()
+        self.update()
+    
+    def update_options(self, new_options_config: List[Dict[str, Any]]):
+        """Aktualizuje konfiguráciu options"""
+        self.options_config = new_options_config
+        self._rebuild_options()
+        self.update()
+    
+    def update_all(self, new_label_config: Dict[str, Any], new_options_config: List[Dict[str, Any]]):
+        """Kompletná aktualizácia"""
+        self.label_config = new_label_config
+        self.options_config = new_options_config
+        self._rebuild_options()
+        self.update()
+    
+    def _apply_localized_text(self) -> bool:
+        if len(self.options or []) != len(self.options_config):
+            self._rebuild_options()
+            return True
+        label_changed = self._set_if_changed(
+            self,
+            "label",
+            self.localization.get(
+                self.label_config["key"],
+                self.label_config.get("default", f"[{self.label_config['key']}]")
+            )
+        )
+        return self._patch_labels(self.options, self.options_config, "text") or label_changed
+        
+class LocalizedFormattedText(LocalizedMixin, ft.Text):
+    """Číslo, suma alebo dátum formátovaný podľa jazyka, pri prepnutí sa preformátuje"""
+    KINDS = ("number", "currency", "date")
+
+    def __init__(
+        self,
+        localization: LocalizationService,
+        value: Any,
+        kind: str = "number",
+        options: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        """
+        kind: number, currency alebo date (metóda LocaleFormatter)
+        options: parametre formátovača, napr. {"decimals": 2} alebo {"currency": "CZK"}
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Neznámy typ formátovania: {kind}")
+        self.formatted_value = value
+        self.kind = kind
+        self.options = options or {}
+        super().__init__(localization=localization, **kwargs)
+        self._apply_localized_text()
+
+    def _apply_localized_text(self) -> bool:
+        format_value = getattr(self.localization.formatter(), self.kind)
+        return self._set_if_changed(self, "value", format_value(self.formatted_value, **self.options))
+
+    def set_value(self, value: Any) -> None:
+        """Zmení formátovanú hodnotu a prekreslí komponent"""
+        self.formatted_value = value
+        self.update_localization()
+
+    def localization_keys(self) -> Optional[Set[str]]:
+        # Nepoužíva kľúče prekladov, zmena katalógov ho neovplyvní
+        return set()
+
+class LocalizedListView(ft.ListView):
+    """ListView pre veľké zoznamy - pri zmene jazyka sa prekladajú iba viditeľné riadky
+
+    Riadky sú Localized* komponenty vytvorené s listen=False, listener má iba
+    zoznam. Zmena jazyka zvýši generáciu zoznamu, riadok mimo viditeľného okna
+    ostáva neaktuálny a preloží sa až keď sa k nemu doscrolluje.
+    """
+    def __init__(
+        self,
+        localization: LocalizationService,
+        controls: Optional[List[ft.Control]] = None,
+        item_extent: float = 48,
+        overscan: int = 10,
+        visible_count: int = 30,
+        **kwargs
+    ):
+        self._user_on_scroll = kwargs.pop("on_scroll", None)
+        super().__init__(controls=controls or [], item_extent=item_extent, **kwargs)
+        self.localization = localization
+        self.overscan = overscan
+        self._generation = 0
+        self._first_visible = 0
+        self._visible_count = visible_count  # Odhad do prvej scroll udalosti
+        self.on_scroll = self._handle_scroll
+        self.localization.add_listener(self.update_localization)
+
+    def update_localization(self) -> None:
+        self._generation += 1
+        if self._refresh_window() and getattr(self, 'page', None) is not None:
+            if not self.localization.request_update(self):
+                self.update()
+
+    def _refresh_window(self) -> bool:
+        """Preloží neaktuálne riadky vo viditeľnom okne, vráti True pri zmene"""
+        start = max(0, self._first_visible - self.overscan)
+        end = self._first_visible + self._visible_count + self.overscan
+        changed = False
+        for row in self.controls[start:end]:
+            if getattr(row, "_l10n_generation", 0) == self._generation:
+                continue
+            row._l10n_generation = self._generation
+            if isinstance(row, LocalizedMixin):
+                changed |= row._update_text()
+        return changed
+
+    def _handle_scroll(self, e) -> None:
+        if self.item_extent:
+            self._first_visible = int(e.pixels // self.item_extent)
+            self._visible_count = int(e.viewport_dimension // self.item_extent) + 1
+            if self._refresh_window():
+                self.update()
+        if self._user_on_scroll is not None:
+            self._user_on_scroll(e)
+
+    def dispose(self):
+        self.localization.remove_listener(self.update_localization)
+        super().dispose()
+
+# Inicializácia
+# dropdown = LocalizedDropdown(
+#     loc_service,
+#     label_config={
+#         "key": "country_label",
+#         "default": "Vyber krajinu"
+#     },
+#     options_config=[
+#         {"key": "sk_option", "default": "Slovensko"},
+#         {"key": "cz_option", "default": "Česko"},
+#         {"key": "en_option", "default": "Anglicko"}
+#     ]
+# )
+
+# Dynamická zmena labelu
+# dropdown.update_label({
+#     "key": "new_label_key",
+#     "default": "Nový defaultný label"
+# })
+
+# Dynamická zmena options
+# dropdown.update_options([
+#     {"key": "de_option", "default": "Nemecko"},
+#     {"key": "fr_option", "default": "Francúzsko"}
+# ])
+
+# Kompletná aktualizácia
+# dropdown.update_all(
+#     {"key": "city_label", "default": "Vyber mesto"},
+#     [
+#         {"key": "ba_option", "default": "Bratislava"},
+#         {"key": "pr_option", "default": "Praha"}
+#     ]
+# )
\ No newline at end of file
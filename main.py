@@ -1,8 +1,19 @@
 import os
+import logging
 import flet as ft
 from locales.localization import LocalizationService
+from locales.view_cache import ViewCache
 from views.login_page import LoginPage
 
+# Nastavenie loggera
+logging.basicConfig(level=logging.INFO)
+
+# Inicializácia s vlastným fallback jazykom, jedna služba pre celý proces
+localization = LocalizationService(
+    fallback_locale="cs",
+    default_locale="sk"
+)
+
         
 def main(page: ft.Page):
     page.title = "Flet Localization"
@@ -10,17 +21,17 @@ def main(page: ft.Page):
     page.window.width = 400
     page.window.height = 800
     
-    # Inicializácia s vlastným fallback jazykom
-    loc_service = LocalizationService(
-        fallback_locale="cs",
-        default_locale="sk"
-    )
+    # Každá session má vlastný jazyk a listenery, katalógy sú zdieľané
+    loc_service = localization.session()
+    # Postavené view sa pri navigácii znovu použijú
+    view_cache = ViewCache(loc_service)
     
     def route_change(route):
+        view_cache.hide_all()
         page.views.clear()
         
         if page.route == "/login":
-            page.views.append(LoginPage(page, loc_service))
+            page.views.append(view_cache.get("/login", lambda: LoginPage(page, loc_service)))
         page.update()
         
     page.on_route_change = route_change